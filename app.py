@@ -23,6 +23,7 @@ def create_app() -> Flask:
     app.config["UPLOAD_FOLDER"] = config.UPLOAD_FOLDER
     app.config["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
     app.config["CLAUDE_MODEL"] = config.CLAUDE_MODEL
+    app.config["ANALYSIS_WORKERS"] = config.ANALYSIS_WORKERS
 
     from web.routes import bp
     app.register_blueprint(bp)
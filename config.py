@@ -13,4 +13,5 @@ UPLOAD_FOLDER = os.environ.get(
 MAX_CONTENT_LENGTH = int(os.environ.get("MAX_UPLOAD_MB", "50")) * 1024 * 1024
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 CLAUDE_MODEL = os.environ.get("CLAUDE_MODEL", "claude-sonnet-4-6")
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", "4"))
 SECRET_KEY = os.environ.get("FLASK_SECRET_KEY", "dev-key-change-in-production")
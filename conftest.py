@@ -3,3 +3,10 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / "skill"))
+
+
+def pytest_configure(config):
+    # Registered here so the mark is known even without pytest-xdist installed.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run these tests on the same xdist worker"
+    )
@@ -10,11 +10,13 @@ Run from anywhere:
 
 from __future__ import annotations
 
+import os
 import shutil
 import sys
 from pathlib import Path
 
 SKILL_NAME = "jetbriefcheck"
+IGNORE = shutil.ignore_patterns("__pycache__", "*.pyc")
 
 
 def _get_skills_dir() -> Path:
@@ -24,6 +26,30 @@ def _get_skills_dir() -> Path:
     return skills_dir
 
 
+def _copy_if_changed(src: str, dst: str) -> str:
+    """copy2, skipping files whose size and mtime already match the target."""
+    try:
+        s, d = os.stat(src), os.stat(dst)
+        if s.st_size == d.st_size and s.st_mtime_ns == d.st_mtime_ns:
+            return dst
+    except FileNotFoundError:
+        pass
+    return shutil.copy2(src, dst)
+
+
+def _prune_stale(src: Path, dst: Path) -> None:
+    """Remove files and directories from *dst* that no longer exist in *src*."""
+    for entry in list(dst.iterdir()):
+        counterpart = src / entry.name
+        if entry.is_dir() and not entry.is_symlink():
+            if counterpart.is_dir():
+                _prune_stale(counterpart, entry)
+            else:
+                shutil.rmtree(entry)
+        elif not counterpart.exists() or counterpart.is_dir():
+            entry.unlink()
+
+
 def main() -> None:
     repo_root = Path(__file__).resolve().parent
     skill_src = repo_root / "skill"
@@ -38,10 +64,13 @@ def main() -> None:
         print(f"Removing old symlink: {target}")
         target.unlink()
 
-    if target.exists():
-        shutil.rmtree(target)
-
-    shutil.copytree(skill_src, target, ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+    # Incremental sync: drop entries the source no longer has (including
+    # ones that changed between file and directory), then copy only the
+    # files that changed since the last deploy
+    if target.is_dir():
+        _prune_stale(skill_src, target)
+    shutil.copytree(skill_src, target, ignore=IGNORE,
+                    copy_function=_copy_if_changed, dirs_exist_ok=True)
     print(f"Deployed to {target}")
 
 
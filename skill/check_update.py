@@ -9,7 +9,6 @@ Fails open — never blocks the user's work.
 import json
 import sys
 import time
-import urllib.request
 from pathlib import Path
 
 REPO = "jet52/jetbriefcheck"
@@ -62,6 +61,8 @@ def _write_cache(remote_version: str) -> None:
 
 def _fetch_latest() -> str | None:
     """Fetch the latest release tag from GitHub."""
+    import urllib.request
+
     req = urllib.request.Request(
         GITHUB_API, headers={"Accept": "application/vnd.github+json"}
     )
@@ -11,6 +11,7 @@ Uses aggressive text normalization and fuzzy matching to handle:
 
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 
@@ -29,7 +30,13 @@ def classify_brief(metadata: BriefMetadata) -> BriefType:
 
     Priority within each pass: amicus > reply > cross-appeal > appellee > appellant.
     """
-    text = _normalize(metadata.cover_text)
+    return _classify_cover_text(metadata.cover_text)
+
+
+@functools.lru_cache(maxsize=128)
+def _classify_cover_text(cover_text: str) -> BriefType:
+    """Classify from cover text alone; cached since the result depends only on it."""
+    text = _normalize(cover_text)
 
     # ---- Pass 0: petition for rehearing ----
     if _match_petition_rehearing(text):
@@ -0,0 +1,60 @@
+"""Single entry point for running every compliance check on a brief.
+
+The semantic checks are one Claude API round trip; both entry points run the
+mechanical checks while that call is in flight, so a brief costs
+max(mechanical, semantic) rather than their sum.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import anthropic
+
+from core.checks_mechanical import run_mechanical_checks
+from core.checks_semantic import run_semantic_checks, run_semantic_checks_async
+from core.models import BriefMetadata, CheckResult
+
+
+def run_all_checks(
+    metadata: BriefMetadata,
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-6",
+    client: Optional[anthropic.Anthropic] = None,
+) -> list[CheckResult]:
+    """Run the mechanical and semantic checks on classified metadata.
+
+    The semantic API call runs on a helper thread while the mechanical
+    checks run on this one. Results come back in report order: mechanical
+    first, then semantic.
+    """
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        semantic = ex.submit(
+            run_semantic_checks, metadata, api_key=api_key, model=model, client=client,
+        )
+        results = run_mechanical_checks(metadata)
+        results.extend(semantic.result())
+    return results
+
+
+async def run_all_checks_async(
+    metadata: BriefMetadata,
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-6",
+    cache: bool = True,
+    client: Optional[anthropic.AsyncAnthropic] = None,
+) -> list[CheckResult]:
+    """Async variant of run_all_checks for callers that own an event loop.
+
+    The mechanical checks run in a worker thread alongside the
+    AsyncAnthropic semantic call.
+    """
+    mech_results, sem_results = await asyncio.gather(
+        asyncio.to_thread(run_mechanical_checks, metadata),
+        run_semantic_checks_async(
+            metadata, api_key=api_key, model=model, cache=cache, client=client,
+        ),
+    )
+    return mech_results + sem_results
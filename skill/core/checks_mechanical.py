@@ -9,6 +9,7 @@ from __future__ import annotations
 import re
 import statistics
 from collections import Counter
+from typing import Callable
 
 from core.constants import (
     FONT_NONCOMPLIANT_THRESHOLD,
@@ -36,21 +37,12 @@ from core.models import BriefMetadata, BriefType, CheckResult, Severity
 def run_mechanical_checks(metadata: BriefMetadata) -> list[CheckResult]:
     """Run all mechanical (deterministic) checks and return results."""
     results = []
-
-    results.append(_check_paper_size(metadata))
-    results.extend(_check_margins(metadata))
-    results.extend(_check_fonts(metadata))
-    results.append(_check_double_spacing(metadata))
-    results.append(_check_footnote_spacing(metadata))
-    results.extend(_check_page_numbering(metadata))
-    results.append(_check_page_limit(metadata))
-    results.append(_check_cover_color(metadata))
-    results.append(_check_oral_argument(metadata))
-    results.append(_check_paragraph_numbering(metadata))
-    results.append(_check_certificate_of_compliance(metadata))
-    results.append(_check_record_citations(metadata))
-    results.append(_check_medium_neutral_citations(metadata))
-
+    for check in CHECKS:
+        result = check(metadata)
+        if isinstance(result, list):
+            results.extend(result)
+        else:
+            results.append(result)
     return results
 
 
@@ -100,6 +92,8 @@ def _check_margins(metadata: BriefMetadata) -> list[CheckResult]:
         bad_pages = []
         min_found = None
         for p in metadata.pages:
+            if not p.layout_measured:
+                continue
             val = getattr(p, attr)
             if val < minimum - MARGIN_TOLERANCE:
                 bad_pages.append(p.page_number + 1)
@@ -191,9 +185,24 @@ def _classify_font_span(
         body font size (conventional small-caps formatting)
       - ``"body"``          — everything else (genuine undersized body text)
     """
-    origin_y = font.get("origin_y", page_height_pts / 2)
-    top_zone = page_height_pts * 0.10
-    bottom_zone = page_height_pts * 0.90
+    return _classify_span_in_zones(
+        font, page_height_pts * 0.10, page_height_pts * 0.90, predominant_size,
+    )
+
+
+def _classify_span_in_zones(
+    font: dict,
+    top_zone: float,
+    bottom_zone: float,
+    predominant_size: float | None = None,
+) -> str:
+    """_classify_font_span with the page's header/footer bounds precomputed.
+
+    Spans without an origin are placed mid-page.
+    """
+    origin_y = font.get("origin_y")
+    if origin_y is None:
+        origin_y = (top_zone + bottom_zone) / 2
 
     if origin_y <= top_zone or origin_y >= bottom_zone:
         return "header_footer"
@@ -269,36 +278,30 @@ def _check_font_size_per_page(metadata: BriefMetadata) -> CheckResult:
     threshold = MIN_FONT_SIZE_PT - FONT_SIZE_TOLERANCE
     predominant = metadata.predominant_font_size
     page_issues: list[dict] = []  # one entry per page that has noncompliant chars
+    classify = _classify_span_in_zones
 
     for p in metadata.pages:
         if not p.fonts:
             continue
 
+        # Only sub-threshold spans need classifying; most pages have none
+        undersized = [f for f in p.fonts if f["size"] < threshold]
+        if not undersized:
+            continue
+
         page_height_pts = p.height_inches * 72.0
-        total_chars = 0
-        nc_body = 0
-        nc_hf = 0
-        nc_super = 0
-        nc_small_caps = 0
-        min_size_on_page: float | None = None
-
-        for f in p.fonts:
-            char_count = f.get("chars", 1)
-            total_chars += char_count
-
-            if f["size"] < threshold:
-                category = _classify_font_span(f, page_height_pts, predominant)
-                if category == "header_footer":
-                    nc_hf += char_count
-                elif category == "superscript":
-                    nc_super += char_count
-                elif category == "small_caps":
-                    nc_small_caps += char_count
-                else:
-                    nc_body += char_count
-
-                if min_size_on_page is None or f["size"] < min_size_on_page:
-                    min_size_on_page = f["size"]
+        top_zone = page_height_pts * 0.10
+        bottom_zone = page_height_pts * 0.90
+        total_chars = sum(f.get("chars", 1) for f in p.fonts)
+        nc_chars = {"header_footer": 0, "superscript": 0, "small_caps": 0, "body": 0}
+        for f in undersized:
+            nc_chars[classify(f, top_zone, bottom_zone, predominant)] += f.get("chars", 1)
+        min_size_on_page = min(f["size"] for f in undersized)
+
+        nc_hf = nc_chars["header_footer"]
+        nc_super = nc_chars["superscript"]
+        nc_small_caps = nc_chars["small_caps"]
+        nc_body = nc_chars["body"]
 
         # --- Layer 2: location-aware weighting ---
         # On non-conventional pages, if small caps exceed the suspicious
@@ -420,6 +423,8 @@ def _check_chars_per_inch(metadata: BriefMetadata) -> str:
     # Use body pages only, skip cover
     high_density_pages = []
     for p in metadata.pages[1:]:  # skip cover
+        if not p.layout_measured:
+            continue
         lines = p.text.split("\n")
         for line in lines:
             stripped = line.strip()
@@ -442,34 +447,29 @@ def _check_chars_per_inch(metadata: BriefMetadata) -> str:
 def _check_font_style(metadata: BriefMetadata) -> str:
     """Check if predominant font is roman (not italic/bold)."""
     # PyMuPDF font flags: bit 0=superscript, bit 1=italic, bit 4=bold
-    all_fonts = []
-    for p in metadata.pages[1:]:  # skip cover
-        all_fonts.extend(p.fonts)
-
-    if not all_fonts:
+    flag_counter = Counter(
+        f.get("flags", 0) for p in metadata.pages[1:] for f in p.fonts  # skip cover
+    )
+    if not flag_counter:
         return ""
 
-    flag_counter = Counter()
-    for f in all_fonts:
-        flags = f.get("flags", 0)
+    style_counter = Counter()
+    for flags, n in flag_counter.items():
         is_italic = bool(flags & 2)
         is_bold = bool(flags & 16)
         if is_italic and is_bold:
-            flag_counter["bold-italic"] += 1
+            style_counter["bold-italic"] += n
         elif is_italic:
-            flag_counter["italic"] += 1
+            style_counter["italic"] += n
         elif is_bold:
-            flag_counter["bold"] += 1
+            style_counter["bold"] += n
         else:
-            flag_counter["roman"] += 1
+            style_counter["roman"] += n
 
-    total = sum(flag_counter.values())
-    if total == 0:
-        return ""
-
-    roman_pct = flag_counter.get("roman", 0) / total
+    total = sum(style_counter.values())
+    roman_pct = style_counter.get("roman", 0) / total
     if roman_pct < 0.5:
-        dominant = flag_counter.most_common(1)[0]
+        dominant = style_counter.most_common(1)[0]
         return (f"Only {roman_pct:.0%} of text spans are plain roman. "
                 f"Most common style: {dominant[0]} ({dominant[1]}/{total} spans).")
     return ""
@@ -526,7 +526,7 @@ def _check_page_numbering(metadata: BriefMetadata) -> list[CheckResult]:
     # FMT-011: Pages numbered at bottom
     unnumbered = []
     for p in metadata.pages:
-        if not p.has_page_number_bottom and p.text.strip():
+        if p.layout_measured and not p.has_page_number_bottom and p.text.strip():
             unnumbered.append(p.page_number + 1)
 
     if unnumbered:
@@ -831,6 +831,25 @@ def _check_medium_neutral_citations(metadata: BriefMetadata) -> CheckResult:
     )
 
 
+# Check registry, in report order. Each check takes the metadata and returns
+# one CheckResult or a list of them.
+CHECKS: list[Callable[[BriefMetadata], CheckResult | list[CheckResult]]] = [
+    _check_paper_size,
+    _check_margins,
+    _check_fonts,
+    _check_double_spacing,
+    _check_footnote_spacing,
+    _check_page_numbering,
+    _check_page_limit,
+    _check_cover_color,
+    _check_oral_argument,
+    _check_paragraph_numbering,
+    _check_certificate_of_compliance,
+    _check_record_citations,
+    _check_medium_neutral_citations,
+]
+
+
 def _page_list(pages: list[int], max_show: int = 10) -> str:
     """Format a list of page numbers for display."""
     if len(pages) <= max_show:
@@ -10,13 +10,17 @@ citations against the authoritative text.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
 import anthropic
 
+from core import claude_cache
+from core.claude_client import get_client
 from core.models import BriefMetadata, BriefType, CheckResult, Severity
 
 # Bundled rules directory (relative to project root)
@@ -190,109 +194,25 @@ SEMANTIC_CHECKS = [
 ]
 
 
-def _find_rule_file(filename: str) -> Path | None:
-    """Find a rule file in the bundled rules directory."""
-    candidate = _PROJECT_RULES_DIR / filename
-    if candidate.exists():
-        return candidate
-    return None
-
-
-def _load_rules_text() -> str:
-    """Load rule text from bundled files (shipped with the skill/project).
-
-    Checks the skill directory first, then the project's references/rules/.
-    If a rule file is not found, includes a placeholder noting the gap.
-    """
-    parts = []
-    for filename in REQUIRED_RULES:
-        filepath = _find_rule_file(filename)
-        if filepath is not None:
-            parts.append(filepath.read_text(encoding="utf-8"))
-        else:
-            rule_num = filename.replace("rule-", "").replace(".md", "")
-            parts.append(
-                f"[Rule {rule_num} text not available. "
-                f"Expected at {_PROJECT_RULES_DIR / filename}]"
-            )
-    return "\n\n---\n\n".join(parts)
-
-
-def run_semantic_checks(
-    metadata: BriefMetadata,
-    api_key: Optional[str] = None,
-    model: str = "claude-sonnet-4-6",
-) -> list[CheckResult]:
-    """Run semantic checks via Claude API.
-
-    Sends the brief text, the actual rule text, and check definitions
-    in a single API call. The prompt instructs Claude to verify all
-    citations against the provided rule text.
-    """
-    # Filter checks applicable to this brief type
-    applicable = []
-    inapplicable = []
-    for check_id, name, rule, types, severity, desc in SEMANTIC_CHECKS:
-        if types is not None and metadata.brief_type not in types:
-            inapplicable.append(CheckResult(
-                check_id=check_id, name=name, rule=rule,
-                passed=True, severity=severity,
-                message=f"Not applicable to {metadata.brief_type.value} briefs.",
-                applicable=False,
-            ))
-        else:
-            applicable.append((check_id, name, rule, severity, desc))
-
-    if not applicable:
-        return inapplicable
-
-    # Build the prompt
-    checks_json = json.dumps([
-        {"id": cid, "name": name, "rule": rule, "description": desc}
-        for cid, name, rule, _, desc in applicable
-    ], indent=2)
-
-    # Load the actual rule text
-    rules_text = _load_rules_text()
-
-    # Truncate brief text if very long (keep first ~60k chars to leave room for rules)
-    brief_text = metadata.full_text
-    if len(brief_text) > 60000:
-        brief_text = brief_text[:60000] + "\n\n[TEXT TRUNCATED]"
-
-    prompt = f"""You are a legal compliance reviewer for the North Dakota Supreme Court.
-Analyze the following appellate brief for compliance with the ND Rules of Appellate Procedure.
-
-Brief type: {metadata.brief_type.value}
-Total pages: {metadata.total_pages}
-Word count: {metadata.word_count}
+# Static system prompt shared by every run; the rule text and brief text
+# follow it as separate system blocks (see _system_blocks).
+_INSTRUCTIONS = """You are a legal compliance reviewer for the North Dakota Supreme Court.
+You will be given the text of an appellate brief and asked to evaluate it for compliance
+with the ND Rules of Appellate Procedure.
 
 IMPORTANT: The authoritative rule text is provided below. You MUST use it to verify every
 rule citation in your response. Do NOT guess or invent subdivision numbers. If a check's
 rule citation does not match what you find in the rule text, use the correct citation from
 the rule text and note the discrepancy.
 
-<rules>
-{rules_text}
-</rules>
-
-The brief text follows:
-
-<brief>
-{brief_text}
-</brief>
-
-Evaluate each of the following checks. For each check, determine whether the brief passes
-or fails, provide a brief explanation, and verify that the rule citation is correct by
-cross-referencing the rule text above.
-
-Checks to evaluate:
-{checks_json}
+For each check listed in the user message, determine whether the brief passes or fails,
+provide a brief explanation, and verify that the rule citation is correct by
+cross-referencing the rule text.
 
 Return ONLY a JSON array with objects having these fields:
 - "id": the check ID
 - "passed": true or false
-- "rule": the correct rule citation (verify against the rule text above — use the exact
+- "rule": the correct rule citation (verify against the rule text — use the exact
   subdivision numbering from the rule text, e.g. "28(b)(1)" not "28(a)(1)")
 - "message": a one-sentence explanation of the finding
 - "details": optional additional detail (null if none)
@@ -329,7 +249,7 @@ Evaluation guidance:
 - CNT-003: Rule 28(g) requires that if "the court's determination of the issues presented
   requires the study of statutes, rules, regulations, etc., the relevant parts must be set
   out in the brief or in an addendum."
-- REC-002: Rule 30(b)(1) requires record citations in the format (R{{index}}:{{page}}), e.g.
+- REC-002: Rule 30(b)(1) requires record citations in the format (R{index}:{page}), e.g.
   (R156:12). Check whether record references in the brief consistently use this format. Note
   any citations that use other formats (e.g., "App. 15", "Doc. 23", "Tr. 45") instead of the
   required (R#:#) format. If the brief uses a mix of formats, note which are non-compliant.
@@ -369,7 +289,7 @@ Evaluation guidance:
   writ petition, pass automatically. If it is, check whether supporting documents are
   referenced or attached as exhibits.
 - WRT-003: Rule 21(a)(3)(B) specifies that supporting documents should be cited using the
-  format (E{{page}}:{{line/para}}), e.g. (E6:12:¶3). If not a writ petition, pass
+  format (E{page}:{line/para}), e.g. (E6:12:¶3). If not a writ petition, pass
   automatically. If it is, check whether exhibit citations use this format.
 - RHR-001: Rule 40(a)(2) requires the petition to "state with particularity each point of law
   or fact that the petitioner believes the court has overlooked or misapprehended." Look for
@@ -393,49 +313,242 @@ Evaluation guidance:
 
 Return ONLY valid JSON, no markdown formatting."""
 
-    key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
-    client = anthropic.Anthropic(api_key=key)
 
-    response = client.messages.create(
-        model=model,
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}],
-    )
+def _find_rule_file(filename: str) -> Path | None:
+    """Find a rule file in the bundled rules directory."""
+    candidate = _PROJECT_RULES_DIR / filename
+    if candidate.exists():
+        return candidate
+    return None
 
-    # Parse the response
+
+def _load_rules_text() -> str:
+    """Load rule text from bundled files (shipped with the skill/project).
+
+    Checks the skill directory first, then the project's references/rules/.
+    If a rule file is not found, includes a placeholder noting the gap.
+    """
+    parts = []
+    for filename in REQUIRED_RULES:
+        filepath = _find_rule_file(filename)
+        if filepath is not None:
+            parts.append(filepath.read_text(encoding="utf-8"))
+        else:
+            rule_num = filename.replace("rule-", "").replace(".md", "")
+            parts.append(
+                f"[Rule {rule_num} text not available. "
+                f"Expected at {_PROJECT_RULES_DIR / filename}]"
+            )
+    return "\n\n---\n\n".join(parts)
+
+
+def _system_blocks(rules_text: str, brief_text: str, cache: bool) -> list[dict]:
+    """Build the structured system prompt: instructions, rules, then the brief.
+
+    The blocks are ordered from most to least stable so the cached prefix
+    (instructions + rules) is shared across briefs and the brief block is
+    shared across re-runs of the same brief.
+    """
+    blocks = [
+        {"type": "text", "text": _INSTRUCTIONS},
+        {"type": "text", "text": f"<rules>\n{rules_text}\n</rules>"},
+        {"type": "text", "text": f"The brief text follows:\n\n<brief>\n{brief_text}\n</brief>"},
+    ]
+    if cache:
+        blocks[1]["cache_control"] = {"type": "ephemeral"}
+        blocks[2]["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
+
+def run_semantic_checks(
+    metadata: BriefMetadata,
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-6",
+    cache: bool = True,
+    client: Optional[anthropic.Anthropic] = None,
+) -> list[CheckResult]:
+    """Run semantic checks via Claude API.
+
+    Sends the brief text, the actual rule text, and check definitions
+    in a single API call. The prompt instructs Claude to verify all
+    citations against the provided rule text.
+
+    With *cache* set, the rule text and brief text are marked as prompt-cache
+    breakpoints, so re-running a brief (or any brief, for the rule text)
+    within the cache TTL is billed at the cached-input rate.  Pass *client*
+    to share one Anthropic client with the recommendation call.
+    """
+    applicable, inapplicable = _partition_checks(metadata)
+    if not applicable:
+        return inapplicable
+
+    request = _build_request(metadata, applicable, model, cache)
+    cache_key = claude_cache.request_key(request)
+    response_text = claude_cache.get(cache_key)
+    if response_text is None:
+        if client is None:
+            client = get_client(api_key)
+        response_text = _response_text(client.messages.create(**request))
+    return _collect_results(response_text, applicable, inapplicable, cache_key)
+
+
+async def run_semantic_checks_async(
+    metadata: BriefMetadata,
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-6",
+    cache: bool = True,
+    client: Optional[anthropic.AsyncAnthropic] = None,
+) -> list[CheckResult]:
+    """Async variant of run_semantic_checks using AsyncAnthropic.
+
+    Lets callers overlap the API round trip with local work (e.g. the
+    mechanical checks) instead of waiting on it.  Pass *client* to reuse one
+    connection pool across several briefs; the caller then owns closing it.
+    """
+    applicable, inapplicable = _partition_checks(metadata)
+    if not applicable:
+        return inapplicable
+
+    request = _build_request(metadata, applicable, model, cache)
+    cache_key = claude_cache.request_key(request)
+    response_text = claude_cache.get(cache_key)
+    if response_text is None:
+        if client is not None:
+            response = await client.messages.create(**request)
+        else:
+            key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
+            async with anthropic.AsyncAnthropic(api_key=key) as own_client:
+                response = await own_client.messages.create(**request)
+        response_text = _response_text(response)
+    return _collect_results(response_text, applicable, inapplicable, cache_key)
+
+
+def _partition_checks(metadata: BriefMetadata) -> tuple[list[tuple], list[CheckResult]]:
+    """Split SEMANTIC_CHECKS into those to send to Claude and not-applicable results."""
+    applicable = []
+    inapplicable = []
+    for check_id, name, rule, types, severity, desc in SEMANTIC_CHECKS:
+        if types is not None and metadata.brief_type not in types:
+            inapplicable.append(CheckResult(
+                check_id=check_id, name=name, rule=rule,
+                passed=True, severity=severity,
+                message=f"Not applicable to {metadata.brief_type.value} briefs.",
+                applicable=False,
+            ))
+        else:
+            applicable.append((check_id, name, rule, severity, desc))
+    return applicable, inapplicable
+
+
+# Trailing spaces/tabs at the end of each line
+_TRAILING_WS_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=8)
+def _canonical_brief_text(full_text: str) -> str:
+    """Normalize the brief text sent to Claude so repeat sends are byte-identical.
+
+    Line endings become \\n, trailing whitespace is dropped from each line, and
+    very long text is truncated (first ~60k chars, leaving room for the rules).
+    Cached so every call for the same brief reuses one string, keeping the
+    prompt-cache prefix stable.
+    """
+    text = _TRAILING_WS_RE.sub("", full_text.replace("\r\n", "\n").replace("\r", "\n")).rstrip()
+    if len(text) > 60000:
+        text = text[:60000] + "\n\n[TEXT TRUNCATED]"
+    return text
+
+
+def _build_request(
+    metadata: BriefMetadata,
+    applicable: list[tuple],
+    model: str,
+    cache: bool,
+) -> dict:
+    """Build the messages.create keyword arguments for the semantic check call."""
+    checks_json = json.dumps([
+        {"id": cid, "name": name, "rule": rule, "description": desc}
+        for cid, name, rule, _, desc in applicable
+    ], indent=2)
+
+    # Load the actual rule text
+    rules_text = _load_rules_text()
+
+    brief_text = _canonical_brief_text(metadata.full_text)
+
+    user_prompt = f"""Brief type: {metadata.brief_type.value}
+Total pages: {metadata.total_pages}
+Word count: {metadata.word_count}
+
+Checks to evaluate:
+{checks_json}"""
+
+    return {
+        "model": model,
+        "max_tokens": 4096,
+        "system": _system_blocks(rules_text, brief_text, cache),
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
+
+
+def _response_text(response) -> str:
+    """Reply text from an API response, with any markdown code fences removed."""
     response_text = response.content[0].text.strip()
     # Strip markdown code fences if present
     if response_text.startswith("```"):
         lines = response_text.split("\n")
         lines = [l for l in lines if not l.startswith("```")]
         response_text = "\n".join(lines)
+    return response_text
+
+
+def _collect_results(
+    response_text: str,
+    applicable: list[tuple],
+    inapplicable: list[CheckResult],
+    cache_key: Optional[str] = None,
+) -> list[CheckResult]:
+    """Turn the reply text into results for every semantic check.
 
-    results = _parse_semantic_response(response_text, applicable)
+    With *cache_key*, a reply that parses is stored in the result cache.
+    """
+    try:
+        data = _decode_response(response_text)
+    except ValueError as e:
+        results = _fallback_results(applicable, str(e))
+    else:
+        if cache_key is not None:
+            claude_cache.put(cache_key, response_text)
+        results = _parse_semantic_response(data, applicable)
     results.extend(inapplicable)
     return results
 
 
-def _parse_semantic_response(
-    response_text: str,
-    checks: list[tuple],
-) -> list[CheckResult]:
-    """Parse Claude's JSON response into CheckResult objects.
+def _decode_response(response_text: str) -> list:
+    """Decode the JSON array in Claude's reply.
 
-    If Claude returns a corrected rule citation, use it instead of the default.
+    Raises ValueError, with a message fit for the report, if there is none.
     """
     try:
-        data = json.loads(response_text)
+        return json.loads(response_text)
     except json.JSONDecodeError:
-        import re
         match = re.search(r"\[.*\]", response_text, re.DOTALL)
-        if match:
-            try:
-                data = json.loads(match.group())
-            except json.JSONDecodeError:
-                return _fallback_results(checks, "Failed to parse Claude API response as JSON.")
-        else:
-            return _fallback_results(checks, "Claude API returned non-JSON response.")
+        if not match:
+            raise ValueError("Claude API returned non-JSON response.") from None
+        try:
+            return json.loads(match.group())
+        except json.JSONDecodeError:
+            raise ValueError("Failed to parse Claude API response as JSON.") from None
+
 
+def _parse_semantic_response(
+    data: list,
+    checks: list[tuple],
+) -> list[CheckResult]:
+    """Turn Claude's decoded JSON response into CheckResult objects.
+
+    If Claude returns a corrected rule citation, use it instead of the default.
+    """
     # Build a lookup for check metadata
     check_map = {cid: (name, rule, severity, desc) for cid, name, rule, severity, desc in checks}
 
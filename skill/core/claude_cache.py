@@ -0,0 +1,55 @@
+"""In-process cache of Claude semantic-check replies.
+
+Entries are keyed by a BLAKE2b digest of everything that determines the
+reply (model, system prompt text, user prompt), so re-analysing an
+unchanged brief reuses the earlier answer instead of another API round trip.
+Only replies that parsed as JSON are stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+_MAX_ENTRIES = 4096
+
+_entries: OrderedDict[str, str] = OrderedDict()
+_lock = threading.Lock()
+
+
+def request_key(request: dict) -> str:
+    """Digest of a messages.create request, ignoring prompt-cache markers."""
+    h = hashlib.blake2b(digest_size=32)
+    h.update(f"{request['model']}\0{request['max_tokens']}".encode("utf-8"))
+    for block in request["system"]:
+        h.update(b"\0")
+        h.update(block["text"].encode("utf-8"))
+    for message in request["messages"]:
+        h.update(f"\0{message['role']}\0{message['content']}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached reply text for *key*, or None."""
+    with _lock:
+        text = _entries.get(key)
+        if text is not None:
+            _entries.move_to_end(key)
+        return text
+
+
+def put(key: str, text: str) -> None:
+    """Store a reply, evicting the least recently used past the size cap."""
+    with _lock:
+        _entries[key] = text
+        _entries.move_to_end(key)
+        while len(_entries) > _MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def clear() -> None:
+    """Drop every cached reply."""
+    with _lock:
+        _entries.clear()
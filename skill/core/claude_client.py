@@ -0,0 +1,24 @@
+"""Shared Anthropic client for the synchronous Claude calls.
+
+The semantic checks and the recommendation weighting pass both go through
+get_client, so repeat calls with the same API key reuse one client and its
+connection pool.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import Optional
+
+import anthropic
+
+
+def get_client(api_key: Optional[str] = None) -> anthropic.Anthropic:
+    """Return the shared client for *api_key* (default: $ANTHROPIC_API_KEY)."""
+    return _client_for_key(api_key or os.environ.get("ANTHROPIC_API_KEY", ""))
+
+
+@functools.lru_cache(maxsize=4)
+def _client_for_key(api_key: str) -> anthropic.Anthropic:
+    return anthropic.Anthropic(api_key=api_key)
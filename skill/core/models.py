@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
 from typing import Optional
 
@@ -29,6 +30,18 @@ class Recommendation(Enum):
     CORRECTION_LETTER = "correction_letter"
     REJECT = "reject"
 
+    @property
+    def rank(self) -> int:
+        """Escalation order: ACCEPT < CORRECTION_LETTER < REJECT."""
+        return _RECOMMENDATION_RANK[self]
+
+
+_RECOMMENDATION_RANK = {
+    Recommendation.ACCEPT: 0,
+    Recommendation.CORRECTION_LETTER: 1,
+    Recommendation.REJECT: 2,
+}
+
 
 @dataclass
 class CheckResult:
@@ -46,6 +59,19 @@ class CheckResult:
     def failed(self) -> bool:
         return not self.passed and self.applicable
 
+    def to_public_dict(self) -> dict:
+        """JSON-ready dict of the fields written to the intermediate file."""
+        return {
+            "check_id": self.check_id,
+            "name": self.name,
+            "rule": self.rule,
+            "passed": self.passed,
+            "severity": self.severity.value,
+            "message": self.message,
+            "details": self.details,
+            "applicable": self.applicable,
+        }
+
 
 @dataclass
 class PageInfo:
@@ -62,6 +88,7 @@ class PageInfo:
     text: str = ""
     has_page_number_bottom: bool = False
     page_number_text: Optional[str] = None  # the printed page number if found
+    layout_measured: bool = True  # False for text-only pages (margins/fonts/numbers not measured)
 
 
 @dataclass
@@ -118,3 +145,31 @@ class ComplianceReport:
     @property
     def note_failures(self) -> list[CheckResult]:
         return [r for r in self.failed_checks if r.severity == Severity.NOTE]
+
+    @cached_property
+    def api_payload(self) -> dict:
+        """JSON-ready summary for the web API, built once per report.
+
+        Computed on first access, so set report_id and the results first.
+        """
+        failed = self.failed_checks
+        return {
+            "report_id": self.report_id,
+            "recommendation": self.recommendation.value,
+            "brief_type": self.brief_type.value,
+            "total_checks": len(self.results),
+            "failed_checks": len(failed),
+            "passed_checks": len(self.passed_checks),
+            "reasoning": self.claude_reasoning,
+            "failures": [
+                {
+                    "check_id": r.check_id,
+                    "name": r.name,
+                    "rule": r.rule,
+                    "severity": r.severity.value,
+                    "message": r.message,
+                    "details": r.details,
+                }
+                for r in failed
+            ],
+        }
@@ -2,57 +2,72 @@
 
 from __future__ import annotations
 
+import bisect
 import re
 import statistics
 from collections import Counter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import fitz  # PyMuPDF
 
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
 from core.constants import ADDENDUM_PATTERN
 from core.models import BriefMetadata, PageInfo
 
+_ADDENDUM_RE = re.compile(ADDENDUM_PATTERN, re.MULTILINE)
+_PAGE_SEP = "\n\n"
+
 
-def extract_brief(pdf_path: str | Path) -> BriefMetadata:
-    """Extract all relevant metadata from a PDF brief."""
-    pdf_path = Path(pdf_path)
-    doc = fitz.open(str(pdf_path))
+def extract_brief(pdf_path: str | Path, text_only_addendum: bool = False) -> BriefMetadata:
+    """Extract all relevant metadata from a PDF brief.
 
+    With *text_only_addendum*, pages after the addendum heading are read
+    for text only; their layout (fonts, margins, spacing, page numbers) is
+    not measured and they are marked ``layout_measured=False``.
+    """
     pages: list[PageInfo] = []
-    all_text_parts: list[str] = []
-    all_fonts: list[dict] = []
+    size_counter: Counter = Counter()  # rounded size -> span count
+    name_counter: Counter = Counter()  # font name -> span count
+    min_font: Optional[float] = None
     line_spacings: list[float] = []
-    addendum_start: Optional[int] = None
+    page_offsets: list[int] = []  # start of each page's text within full_text
+    offset = 0
 
-    for page_idx in range(len(doc)):
-        page = doc[page_idx]
-        page_info = _extract_page(page, page_idx)
+    for page_info in iter_pages(pdf_path, text_only_addendum):
         pages.append(page_info)
-        all_text_parts.append(page_info.text)
-        all_fonts.extend(page_info.fonts)
+        page_offsets.append(offset)
+        offset += len(page_info.text) + len(_PAGE_SEP)
+        for f in page_info.fonts:
+            size = f["size"]
+            if size > 0:
+                size_counter[round(size, 1)] += 1
+                if min_font is None or size < min_font:
+                    min_font = size
+            if f["name"]:
+                name_counter[f["name"]] += 1
         if page_info.line_spacing is not None:
             line_spacings.append(page_info.line_spacing)
 
-        # Detect addendum start
-        if addendum_start is None and re.search(ADDENDUM_PATTERN, page_info.text, re.MULTILINE):
-            addendum_start = page_idx
+    full_text = _PAGE_SEP.join(p.text for p in pages)
 
-    doc.close()
-
-    full_text = "\n\n".join(all_text_parts)
+    # Detect addendum start with one scan of the full text, mapping the
+    # heading's position back to its page.
+    addendum_start: Optional[int] = None
+    m = _ADDENDUM_RE.search(full_text)
+    if m:
+        # Leading \s* may run back across a page break; use the word itself
+        heading_pos = m.start() + len(m.group()) - len(m.group().lstrip())
+        addendum_start = bisect.bisect_right(page_offsets, heading_pos) - 1
     cover_text = pages[0].text if pages else ""
 
-    # Font statistics
-    font_sizes = [f["size"] for f in all_fonts if f["size"] > 0]
-    font_names = [f["name"] for f in all_fonts if f["name"]]
-
-    size_counter = Counter(round(s, 1) for s in font_sizes)
-    name_counter = Counter(font_names)
-
+    # Font statistics (counted per page above)
     predominant_size = size_counter.most_common(1)[0][0] if size_counter else None
     predominant_font = name_counter.most_common(1)[0][0] if name_counter else None
-    min_font = min(font_sizes) if font_sizes else None
 
     # Double spacing check
     has_double = True
@@ -100,15 +115,17 @@ def _extract_page(page: fitz.Page, page_idx: int) -> PageInfo:
             continue
         for line in block.get("lines", []):
             for span in line.get("spans", []):
-                if span["text"].strip():
-                    fonts.append({
-                        "name": span["font"],
-                        "size": span["size"],
-                        "flags": span["flags"],  # bold/italic flags
-                        "chars": len(span["text"].strip()),
-                        "origin_y": span["origin"][1],
-                        "text": span["text"].strip(),  # for small caps detection
-                    })
+                span_text = span["text"].strip()
+                if not span_text:
+                    continue
+                fonts.append({
+                    "name": span["font"],
+                    "size": span["size"],
+                    "flags": span["flags"],  # bold/italic flags
+                    "chars": len(span_text),
+                    "origin_y": span["origin"][1],
+                    "text": span_text,  # for small caps detection
+                })
 
     # Margins: find bounding box of all content
     left_margin, right_margin, top_margin, bottom_margin = (
@@ -137,6 +154,47 @@ def _extract_page(page: fitz.Page, page_idx: int) -> PageInfo:
     )
 
 
+def iter_pages(pdf_path: str | Path, text_only_addendum: bool = False) -> Iterator[PageInfo]:
+    """Yield a PageInfo for each page of the PDF, one page at a time.
+
+    Only the current page's PyMuPDF structures are alive at any point, and the
+    document is closed when the generator finishes or is discarded.  With
+    *text_only_addendum*, pages after the first one containing the addendum
+    heading are read for text only (see extract_brief).
+    """
+    doc = fitz.open(str(Path(pdf_path)))
+    try:
+        in_addendum = False
+        for page_idx in range(len(doc)):
+            page = doc[page_idx]
+            if in_addendum:
+                yield _extract_page_text_only(page, page_idx)
+                continue
+            page_info = _extract_page(page, page_idx)
+            if text_only_addendum and _ADDENDUM_RE.search(page_info.text):
+                in_addendum = True
+            yield page_info
+    finally:
+        doc.close()
+
+
+def _extract_page_text_only(page: fitz.Page, page_idx: int) -> PageInfo:
+    """Extract only dimensions and plain text from a page (no layout analysis)."""
+    rect = page.rect
+    left, right, top, bottom = _compute_margins([], rect)
+    return PageInfo(
+        page_number=page_idx,
+        width_inches=rect.width / 72.0,
+        height_inches=rect.height / 72.0,
+        left_margin_inches=left,
+        right_margin_inches=right,
+        top_margin_inches=top,
+        bottom_margin_inches=bottom,
+        text=page.get_text("text"),
+        layout_measured=False,
+    )
+
+
 def _compute_margins(blocks: list[dict], rect: fitz.Rect) -> tuple[float, float, float, float]:
     """Compute margins in inches from text block positions.
 
@@ -170,11 +228,7 @@ def _compute_margins(blocks: list[dict], rect: fitz.Rect) -> tuple[float, float,
 
         # Skip page-number blocks in the bottom zone for margin calculation
         if bbox[1] >= bottom_zone:
-            block_text = ""
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    block_text += span["text"]
-            block_text = block_text.strip()
+            block_text = _block_text(block)
             if _PAGE_NUM_RE.match(block_text) or _ROMAN_RE.match(block_text):
                 continue
 
@@ -199,13 +253,31 @@ def _compute_margins(blocks: list[dict], rect: fitz.Rect) -> tuple[float, float,
     return left, right, top, bottom
 
 
-def _estimate_line_spacing(blocks: list[dict]) -> Optional[float]:
+def _block_text(block: dict) -> str:
+    """Concatenate all span text in a block, stripped."""
+    return "".join(
+        span["text"]
+        for line in block.get("lines", [])
+        for span in line.get("spans", [])
+    ).strip()
+
+
+def _text_origins(line: dict) -> list[float]:
+    """Baselines of the spans in *line* that contain non-whitespace text."""
+    return [s["origin"][1] for s in line.get("spans", ())
+            if s["text"] and not s["text"].isspace()]
+
+
+def _estimate_line_spacing(blocks: list[dict], *, use_numpy: bool = False) -> Optional[float]:
     """Estimate typical line spacing in points from text block baselines.
 
     Measures both intra-block line gaps and inter-block gaps (for PDFs that
     encode each visual line as a separate block).
+
+    *use_numpy* takes the median with numpy when it is installed; it is off
+    by default until it has been benchmarked on real briefs.
     """
-    spacings = []
+    gaps = []  # raw baseline gaps; outliers are filtered at the end
 
     # 1. Intra-block: gaps between lines within the same block
     for block in blocks:
@@ -213,12 +285,10 @@ def _estimate_line_spacing(blocks: list[dict]) -> Optional[float]:
             continue
         lines = block.get("lines", [])
         for i in range(1, len(lines)):
-            prev_origins = [s["origin"][1] for s in lines[i - 1].get("spans", []) if s["text"].strip()]
-            curr_origins = [s["origin"][1] for s in lines[i].get("spans", []) if s["text"].strip()]
+            prev_origins = _text_origins(lines[i - 1])
+            curr_origins = _text_origins(lines[i])
             if prev_origins and curr_origins:
-                spacing = min(curr_origins) - min(prev_origins)
-                if 8 < spacing < 60:
-                    spacings.append(spacing)
+                gaps.append(min(curr_origins) - min(prev_origins))
 
     # 2. Inter-block: gaps between consecutive single-line text blocks.
     #    Many PDF generators emit each line as its own block, so intra-block
@@ -231,13 +301,18 @@ def _estimate_line_spacing(blocks: list[dict]) -> Optional[float]:
         if not prev_lines or not curr_lines:
             continue
         # Use the last line of prev block and first line of curr block
-        prev_origins = [s["origin"][1] for s in prev_lines[-1].get("spans", []) if s["text"].strip()]
-        curr_origins = [s["origin"][1] for s in curr_lines[0].get("spans", []) if s["text"].strip()]
+        prev_origins = _text_origins(prev_lines[-1])
+        curr_origins = _text_origins(curr_lines[0])
         if prev_origins and curr_origins:
-            spacing = min(curr_origins) - min(prev_origins)
-            if 8 < spacing < 60:
-                spacings.append(spacing)
-
+            gaps.append(min(curr_origins) - min(prev_origins))
+
+    # Gaps of 8 pt or less (overlaps, superscripts) and 60 pt or more (section
+    # breaks) are not line spacing.
+    if use_numpy and np is not None:
+        arr = np.fromiter(gaps, dtype=np.float64, count=len(gaps))
+        arr = arr[(arr > 8.0) & (arr < 60.0)]
+        return float(np.median(arr)) if arr.size else None
+    spacings = [g for g in gaps if 8 < g < 60]
     return statistics.median(spacings) if spacings else None
 
 
@@ -252,11 +327,7 @@ def _detect_page_number(
             continue
         bbox = block["bbox"]
         if bbox[1] >= bottom_zone:
-            block_text = ""
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    block_text += span["text"]
-            block_text = block_text.strip()
+            block_text = _block_text(block)
             # Check if it looks like a page number (digits, possibly with dashes)
             if re.match(r"^[-–—]?\s*\d+\s*[-–—]?$", block_text):
                 return True, block_text.strip()
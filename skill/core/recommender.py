@@ -6,54 +6,100 @@ based on check results, with optional Claude-based borderline adjustment.
 
 from __future__ import annotations
 
-import json
 import os
+import re
 from typing import Optional
 
 import anthropic
 
+from core import json_compat
+from core.claude_client import get_client
 from core.models import CheckResult, ComplianceReport, Recommendation, Severity
 
+# Markdown code fences Claude sometimes wraps around its JSON reply
+_FENCE_RE = re.compile(r"^```[a-zA-Z]*\s*\n?|\n?```\s*$", re.MULTILINE)
+
 
 def compute_recommendation(
     results: list[CheckResult],
     api_key: Optional[str] = None,
     model: str = "claude-sonnet-4-6",
     use_claude_weighting: bool = True,
+    client: Optional[anthropic.Anthropic] = None,
 ) -> tuple[Recommendation, str]:
     """Compute the final recommendation from check results.
 
+    Pass *client* to reuse the Anthropic client (and its connection pool)
+    that made the semantic-check call.
+
     Returns (recommendation, reasoning_text).
     """
     # Step 1: Hard-rule pass
     hard_rec = _hard_rule_pass(results)
-    reasoning = ""
 
     # Step 2: Claude weighting (only if no REJECT failures)
     if use_claude_weighting and hard_rec != Recommendation.REJECT:
-        claude_rec, reasoning = _claude_weighting_pass(results, hard_rec, api_key, model)
-        # Claude can escalate but never downgrade
-        final = max(hard_rec.value, claude_rec.value, key=_rec_rank)
-        final = Recommendation(final)
-    else:
-        final = hard_rec
-        if hard_rec == Recommendation.REJECT:
-            reject_checks = [r for r in results if r.failed and r.severity == Severity.REJECT]
-            reasoning = (
-                f"Automatic REJECT due to {len(reject_checks)} critical failure(s): "
-                + "; ".join(f"{r.check_id} ({r.name})" for r in reject_checks)
-            )
-
-    return final, reasoning
+        claude_rec, reasoning = _claude_weighting_pass(results, hard_rec, api_key, model, client)
+        return _no_downgrade(claude_rec, hard_rec), reasoning
+    return hard_rec, _hard_rule_reasoning(results, hard_rec)
+
+
+async def compute_recommendation_async(
+    results: list[CheckResult],
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-6",
+    use_claude_weighting: bool = True,
+    client: Optional[anthropic.AsyncAnthropic] = None,
+) -> tuple[Recommendation, str]:
+    """Async variant of compute_recommendation for callers holding an AsyncAnthropic client."""
+    hard_rec = _hard_rule_pass(results)
+
+    if use_claude_weighting and hard_rec != Recommendation.REJECT:
+        failed = [r for r in results if r.failed]
+        if not failed:
+            return hard_rec, "All checks passed."
+        try:
+            request = _weighting_request(failed, hard_rec, model)
+            if client is not None:
+                response = await client.messages.create(**request)
+            else:
+                key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
+                async with anthropic.AsyncAnthropic(api_key=key) as own_client:
+                    response = await own_client.messages.create(**request)
+            claude_rec, reasoning = _parse_weighting_response(response, hard_rec)
+        except Exception as e:
+            claude_rec, reasoning = hard_rec, f"Claude weighting unavailable: {e}"
+        return _no_downgrade(claude_rec, hard_rec), reasoning
+    return hard_rec, _hard_rule_reasoning(results, hard_rec)
+
+
+def _no_downgrade(claude_rec: Recommendation, hard_rec: Recommendation) -> Recommendation:
+    """Claude can escalate but never downgrade."""
+    return claude_rec if claude_rec.rank > hard_rec.rank else hard_rec
+
+
+def _hard_rule_reasoning(results: list[CheckResult], hard_rec: Recommendation) -> str:
+    """Reasoning text when Claude weighting is skipped."""
+    if hard_rec != Recommendation.REJECT:
+        return ""
+    reject_checks = [r for r in results if r.failed and r.severity == Severity.REJECT]
+    return (
+        f"Automatic REJECT due to {len(reject_checks)} critical failure(s): "
+        + "; ".join(f"{r.check_id} ({r.name})" for r in reject_checks)
+    )
 
 
 def _hard_rule_pass(results: list[CheckResult]) -> Recommendation:
     """Determine recommendation based strictly on severity levels."""
-    has_reject = any(r.failed and r.severity == Severity.REJECT for r in results)
-    has_correction = any(r.failed and r.severity == Severity.CORRECTION for r in results)
+    has_correction = False
+    for r in results:
+        if not r.failed:
+            continue
+        if r.severity is Severity.REJECT:
+            return Recommendation.REJECT
+        if r.severity is Severity.CORRECTION:
+            has_correction = True
 
-    if has_reject:
-        return Recommendation.REJECT
     if has_correction:
         return Recommendation.CORRECTION_LETTER
     return Recommendation.ACCEPT
@@ -64,6 +110,7 @@ def _claude_weighting_pass(
     hard_rec: Recommendation,
     api_key: Optional[str] = None,
     model: str = "claude-sonnet-4-6",
+    client: Optional[anthropic.Anthropic] = None,
 ) -> tuple[Recommendation, str]:
     """Use Claude to weigh borderline cases.
 
@@ -74,7 +121,23 @@ def _claude_weighting_pass(
     if not failed:
         return Recommendation.ACCEPT, "All checks passed."
 
-    findings = json.dumps([
+    try:
+        if client is None:
+            client = get_client(api_key)
+        response = client.messages.create(**_weighting_request(failed, hard_rec, model))
+        return _parse_weighting_response(response, hard_rec)
+
+    except Exception as e:
+        return hard_rec, f"Claude weighting unavailable: {e}"
+
+
+def _weighting_request(
+    failed: list[CheckResult],
+    hard_rec: Recommendation,
+    model: str,
+) -> dict:
+    """Build the messages.create keyword arguments for the weighting call."""
+    findings = json_compat.dumps([
         {
             "id": r.check_id,
             "name": r.name,
@@ -84,7 +147,7 @@ def _claude_weighting_pass(
             "details": r.details,
         }
         for r in failed
-    ], indent=2)
+    ])
 
     prompt = f"""You are a clerk at the North Dakota Supreme Court reviewing an appellate brief
 compliance report. Based on the following findings, provide your assessment.
@@ -108,41 +171,29 @@ Return a JSON object with:
 
 Return ONLY valid JSON, no markdown."""
 
-    try:
-        key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
-        client = anthropic.Anthropic(api_key=key)
-        response = client.messages.create(
-            model=model,
-            max_tokens=512,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        text = response.content[0].text.strip()
-        if text.startswith("```"):
-            lines = text.split("\n")
-            lines = [l for l in lines if not l.startswith("```")]
-            text = "\n".join(lines)
-
-        data = json.loads(text)
-        rec_str = data.get("recommendation", hard_rec.value)
-        reasoning = data.get("reasoning", "")
+    return {
+        "model": model,
+        "max_tokens": 512,
+        "messages": [{"role": "user", "content": prompt}],
+    }
 
-        try:
-            claude_rec = Recommendation(rec_str)
-        except ValueError:
-            claude_rec = hard_rec
 
-        # Ensure no downgrade
-        if _rec_rank(claude_rec.value) < _rec_rank(hard_rec.value):
-            claude_rec = hard_rec
-            reasoning += " (Claude attempted to downgrade; overridden by hard rules.)"
+def _parse_weighting_response(response, hard_rec: Recommendation) -> tuple[Recommendation, str]:
+    """Read Claude's recommendation, refusing any downgrade below *hard_rec*."""
+    text = _FENCE_RE.sub("", response.content[0].text.strip()).strip()
 
-        return claude_rec, reasoning
+    data = json_compat.loads(text)
+    rec_str = data.get("recommendation", hard_rec.value)
+    reasoning = data.get("reasoning", "")
 
-    except Exception as e:
-        return hard_rec, f"Claude weighting unavailable: {e}"
+    try:
+        claude_rec = Recommendation(rec_str)
+    except ValueError:
+        claude_rec = hard_rec
 
+    # Ensure no downgrade
+    if claude_rec.rank < hard_rec.rank:
+        claude_rec = hard_rec
+        reasoning += " (Claude attempted to downgrade; overridden by hard rules.)"
 
-def _rec_rank(value: str) -> int:
-    """Rank recommendations for comparison."""
-    return {"accept": 0, "correction_letter": 1, "reject": 2}.get(value, 0)
+    return claude_rec, reasoning
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from datetime import datetime
 
@@ -10,25 +11,20 @@ from core.models import CheckResult, ComplianceReport, Recommendation, Severity
 RULES_BASE_URL = "https://www.ndcourts.gov/legal-resources/rules/ndrappp"
 NDRCT_RULES_BASE_URL = "https://www.ndcourts.gov/legal-resources/rules/ndrct"
 
+# Recommendation -> (banner color, banner background, banner label)
+_BANNERS = {
+    Recommendation.ACCEPT: ("#22863a", "#dcffe4", "ACCEPT"),
+    Recommendation.CORRECTION_LETTER: ("#b08800", "#fff8c5", "CORRECTION LETTER"),
+    Recommendation.REJECT: ("#cb2431", "#ffeef0", "REJECT"),
+}
+
+_NDRCT_RULE_RE = re.compile(r"N\.D\.R\.Ct\.\s*([\d.]+)")
+_RULE_NUM_RE = re.compile(r"([\d.]+)")
+
 
 def build_html_report(report: ComplianceReport, version_stamp: str = "") -> str:
     """Generate a self-contained HTML report with inline CSS."""
-    rec = report.recommendation
-    banner_color = {
-        Recommendation.ACCEPT: "#22863a",
-        Recommendation.CORRECTION_LETTER: "#b08800",
-        Recommendation.REJECT: "#cb2431",
-    }[rec]
-    banner_bg = {
-        Recommendation.ACCEPT: "#dcffe4",
-        Recommendation.CORRECTION_LETTER: "#fff8c5",
-        Recommendation.REJECT: "#ffeef0",
-    }[rec]
-    banner_label = {
-        Recommendation.ACCEPT: "ACCEPT",
-        Recommendation.CORRECTION_LETTER: "CORRECTION LETTER",
-        Recommendation.REJECT: "REJECT",
-    }[rec]
+    banner_color, banner_bg, banner_label = _BANNERS[report.recommendation]
 
     failed_html = _render_check_group(report.reject_failures, "Critical — Reject", "#cb2431")
     failed_html += _render_check_group(report.correction_failures, "Correction Required", "#b08800")
@@ -60,7 +56,7 @@ def build_html_report(report: ComplianceReport, version_stamp: str = "") -> str:
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
 <title>Compliance Report — {_esc(report.case_title) if report.case_title else report.report_id}</title>
 <style>
-{_css()}
+{_CSS}
 </style>
 </head>
 <body>
@@ -120,14 +116,14 @@ def build_html_report(report: ComplianceReport, version_stamp: str = "") -> str:
 def _render_check_group(checks: list[CheckResult], title: str, color: str) -> str:
     if not checks:
         return ""
-    rows = ""
+    rows = []
     for c in checks:
         detail = f'<div class="detail">{_esc(c.details)}</div>' if c.details else ""
         pages_html = ""
         if c.pages:
             page_tags = " ".join(f'<span class="page-badge">p.{p}</span>' for p in c.pages)
             pages_html = f'<div class="check-pages">Pages: {page_tags}</div>'
-        rows += f"""<div class="check-card failed" style="border-left-color:{color};">
+        rows.append(f"""<div class="check-card failed" style="border-left-color:{color};">
   <div class="check-header">
     <span class="check-id">{c.check_id}</span>
     <span class="check-name">{_esc(c.name)}</span>
@@ -138,29 +134,29 @@ def _render_check_group(checks: list[CheckResult], title: str, color: str) -> st
   {pages_html}
   {detail}
 </div>
-"""
-    return f'<h3 style="color:{color};">{title}</h3>\n{rows}'
+""")
+    return f'<h3 style="color:{color};">{title}</h3>\n' + "".join(rows)
 
 
 def _render_checks_table(checks: list[CheckResult], passed: bool = True) -> str:
     if not checks:
         return ""
-    rows = ""
+    rows = []
     for c in checks:
         pages_cell = ""
         if c.pages:
             pages_cell = ", ".join(str(p) for p in c.pages)
-        rows += f"""<tr>
+        rows.append(f"""<tr>
   <td class="check-id-cell">{c.check_id}</td>
   <td>{_esc(c.name)}</td>
   <td>{_rule_link(c.rule)}</td>
   <td>{_esc(c.message)}</td>
   <td class="pages-cell">{pages_cell}</td>
 </tr>
-"""
+""")
     return f"""<table class="checks-table">
 <thead><tr><th>ID</th><th>Check</th><th>Rule</th><th>Result</th><th>Pages</th></tr></thead>
-<tbody>{rows}</tbody>
+<tbody>{"".join(rows)}</tbody>
 </table>"""
 
 
@@ -174,20 +170,22 @@ def _esc(text: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=256)
 def _rule_link(rule_str: str) -> str:
     """Convert a rule citation like '32(a)(1)' into an HTML hyperlink.
 
     Maps to the appropriate ndcourts.gov URL:
     - N.D.R.Ct. rules → /legal-resources/rules/ndrct/{rule_number with hyphens}
     - N.D.R.App.P. rules → /legal-resources/rules/ndrappp/{rule_number}
-    Handles compound citations like '28(h)/34'.
+    Handles compound citations like '28(h)/34'. Cached: reports cite the
+    same few rules over and over.
     """
     parts = rule_str.split("/")
     links = []
     for part in parts:
         part = part.strip()
         # Check for N.D.R.Ct. prefix (e.g., "N.D.R.Ct. 11.6(b)")
-        ndrct_match = re.match(r"N\.D\.R\.Ct\.\s*([\d.]+)", part)
+        ndrct_match = _NDRCT_RULE_RE.match(part)
         if ndrct_match:
             rule_num = ndrct_match.group(1)
             # ndcourts.gov uses hyphens for dots in N.D.R.Ct. URLs (e.g., 3-4, 11-6)
@@ -196,7 +194,7 @@ def _rule_link(rule_str: str) -> str:
             links.append(f'<a href="{url}" target="_blank" class="rule-link">N.D.R.Ct. {part[ndrct_match.start(1):]}</a>')
             continue
         # Extract the base rule number (digits/dots before any parenthetical)
-        match = re.match(r"([\d.]+)", part)
+        match = _RULE_NUM_RE.match(part)
         if match:
             rule_num = match.group(1)
             # Determine base URL: rule numbers with dots (like 3.4, 11.6) are N.D.R.Ct.
@@ -211,8 +209,7 @@ def _rule_link(rule_str: str) -> str:
     return " / ".join(links)
 
 
-def _css() -> str:
-    return """
+_CSS = """
 * { box-sizing: border-box; margin: 0; padding: 0; }
 body { font-family: 'Segoe UI', system-ui, -apple-system, sans-serif; background: #f6f8fa; color: #24292e; line-height: 1.5; }
 .container { max-width: 900px; margin: 2rem auto; padding: 0 1rem; }
@@ -9,14 +9,19 @@ Provides:
 
 from __future__ import annotations
 
+import copy
+import functools
 import hashlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
-from urllib.request import Request, urlopen
+
+from core import json_compat
 
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 VERSION_FILE = PROJECT_DIR / "version.json"
@@ -53,43 +58,139 @@ BUNDLED_EFFECTIVE_DATES = {
 EFFECTIVE_DATE_RE = re.compile(r"Effective\s+Date[:\s]+(\d{1,2}/\d{1,2}/\d{4})")
 
 
-def load_local_version() -> dict:
-    """Load the local version.json. Returns empty dict on failure."""
+def _stat_key(path: Path) -> tuple[int, int]:
+    """Return (mtime_ns, size) for *path*, or (0, 0) if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return 0, 0
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=1)
+def _load_version_file(path: Path, stat_key: tuple[int, int]) -> dict:
     try:
-        return json.loads(VERSION_FILE.read_text(encoding="utf-8"))
+        return json_compat.loads(path.read_bytes())
     except (FileNotFoundError, json.JSONDecodeError):
         return {}
 
 
-def compute_rule_hash(rule_file: Path) -> str:
-    """Compute SHA-256 hash of a rule file, prefixed with 'sha256:'."""
-    content = rule_file.read_bytes()
-    return "sha256:" + hashlib.sha256(content).hexdigest()
+def load_local_version() -> dict:
+    """Load the local version.json. Returns empty dict on failure.
+
+    The parsed result is cached until the file's mtime or size changes;
+    callers get their own copy, so mutating it never touches the cache.
+    """
+    return copy.deepcopy(_load_version_file(VERSION_FILE, _stat_key(VERSION_FILE)))
+
+
+def clear_version_cache() -> None:
+    """Drop the cached version.json parse, even if the file's stat is unchanged."""
+    _load_version_file.cache_clear()
+
+
+_HASH_CHUNK_SIZE = 1 << 20  # 1 MiB reads for the pre-3.11 hashing fallback
+_HASH_POOL_MIN_FILES = 2  # at or below this, pool startup costs more than it saves
+
+
+# Digest prefix -> hasher factory. New digests use BLAKE2b (tamper detection
+# only, so it beats SHA-256); sha256 is kept to verify older version.json files.
+_RULE_HASHERS = {
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+    "sha256": hashlib.sha256,
+}
+
+# (rule file, algorithm) -> ((mtime_ns, size), digest); warm lookups cost one
+# stat per file.
+_RULE_HASH_CACHE: dict[tuple[Path, str], tuple[tuple[int, int], str]] = {}
+
+
+def compute_rule_hash(rule_file: Path, algorithm: str = "blake2b") -> str:
+    """Compute a rule file's hash, prefixed with the algorithm (e.g. 'blake2b:').
+
+    *algorithm* is a key of _RULE_HASHERS. The digest is cached until the
+    file's mtime or size changes.
+    """
+    key = _stat_key(rule_file)
+    cached = _RULE_HASH_CACHE.get((rule_file, algorithm))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    new_hasher = _RULE_HASHERS[algorithm]
+
+    # Unbuffered: both paths read straight into their own buffer.
+    with open(rule_file, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            h = hashlib.file_digest(f, new_hasher)
+        else:
+            h = new_hasher()
+            buf = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(view[:n])
+    digest = f"{algorithm}:{h.hexdigest()}"
+    _RULE_HASH_CACHE[rule_file, algorithm] = (key, digest)
+    return digest
 
 
 def compute_all_rule_hashes() -> dict[str, str]:
-    """Compute hashes for all rule files in the rules directory."""
-    hashes = {}
-    if RULES_DIR.is_dir():
-        for f in sorted(RULES_DIR.glob("*.md")):
-            hashes[f.name] = compute_rule_hash(f)
-    return hashes
+    """Compute hashes for all rule files in the rules directory.
+
+    Each file's hash is cached until that file is modified.
+    """
+    if not RULES_DIR.is_dir():
+        return {}
+    paths = sorted(RULES_DIR.glob("*.md"))
+    names = [p.name for p in paths]
+    if len(paths) <= _HASH_POOL_MIN_FILES:
+        return dict(zip(names, map(compute_rule_hash, paths)))
+    # hashlib releases the GIL while hashing, so files can be hashed in parallel.
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        return dict(zip(names, ex.map(compute_rule_hash, paths)))
+
+
+# State key of the last check_rule_hashes call that found no mismatches.
+_LAST_CLEAN_STATE: Optional[tuple] = None
+
+
+def _rule_hash_state(expected: dict[str, str]) -> tuple:
+    """Key that changes if the expected hashes or any rule file may have changed.
+
+    The directory mtime covers files being added or removed; the newest file
+    mtime covers edits in place.
+    """
+    latest = max(
+        (p.stat().st_mtime_ns for p in RULES_DIR.glob("*.md")), default=0,
+    )
+    return tuple(sorted(expected.items())), _stat_key(RULES_DIR), latest
 
 
 def check_rule_hashes(local_version: dict) -> list[str]:
     """Compare on-disk rule hashes against those in version.json.
 
-    Returns a list of warning strings for any mismatches.
+    Each file is hashed with the algorithm named by its expected digest's
+    prefix, so version.json files with older sha256 digests still verify.
+    Returns a list of warning strings for any mismatches. Once a check comes
+    back clean, later calls return [] after a stat pass until something changes.
     """
+    global _LAST_CLEAN_STATE
+
     expected = local_version.get("rule_hashes", {})
     if not expected:
         return []
 
+    state = _rule_hash_state(expected)
+    if state == _LAST_CLEAN_STATE:
+        return []
+
     warnings = []
     actual = compute_all_rule_hashes()
 
     for filename, expected_hash in expected.items():
         actual_hash = actual.get(filename)
+        algorithm = expected_hash.partition(":")[0]
+        if actual_hash is not None and algorithm != "blake2b" and algorithm in _RULE_HASHERS:
+            actual_hash = compute_rule_hash(RULES_DIR / filename, algorithm)
         if actual_hash is None:
             warnings.append(f"Rule file missing: {filename}")
         elif actual_hash != expected_hash:
@@ -98,13 +199,15 @@ def check_rule_hashes(local_version: dict) -> list[str]:
                 f"(hash mismatch)"
             )
 
+    if not warnings:
+        _LAST_CLEAN_STATE = state
     return warnings
 
 
 def _load_staleness_cache() -> dict:
     """Load the cached staleness result. Returns empty dict if missing/corrupt."""
     try:
-        return json.loads(STALENESS_CACHE.read_text(encoding="utf-8"))
+        return json_compat.loads(STALENESS_CACHE.read_bytes())
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return {}
 
@@ -113,13 +216,15 @@ def _save_staleness_cache(data: dict) -> None:
     """Write staleness cache, creating parent dirs as needed."""
     try:
         STALENESS_CACHE.parent.mkdir(parents=True, exist_ok=True)
-        STALENESS_CACHE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        STALENESS_CACHE.write_text(json_compat.dumps(data, indent=True), encoding="utf-8")
     except OSError:
         pass  # fail silently — cache is advisory
 
 
 def _fetch_effective_date(url: str, timeout: float = 10.0) -> Optional[str]:
     """Fetch a rule page on ndcourts.gov and extract the effective date as YYYY-MM-DD."""
+    from urllib.request import Request, urlopen
+
     try:
         req = Request(url, headers={"User-Agent": "jetbriefcheck-freshness-check"})
         with urlopen(req, timeout=timeout) as resp:
@@ -170,21 +275,35 @@ def _check_rules_live() -> list[str]:
     return stale
 
 
+# ((today, cache path, cache stat key), warnings) from the last fresh cache read.
+_STALENESS_MEMO: Optional[tuple[tuple, list[str]]] = None
+
+
 def check_rule_staleness(local_version: dict) -> list[str]:
     """Check bundled rules against ndcourts.gov effective dates (cached).
 
     Uses a local cache at ~/.cache/jetbriefcheck/rule_staleness.json.
     Re-checks live every 90 days. Returns a list of warning strings.
+    A fresh cache is read and parsed at most once per day, or again if the
+    cache file changes.
     """
+    global _STALENESS_MEMO
+
+    today = date.today()
+    memo_key = (today, STALENESS_CACHE, _stat_key(STALENESS_CACHE))
+    if _STALENESS_MEMO is not None and _STALENESS_MEMO[0] == memo_key:
+        return list(_STALENESS_MEMO[1])
+
     cache = _load_staleness_cache()
     last_checked_str = cache.get("last_checked")
 
     if last_checked_str:
         try:
-            last_checked = datetime.strptime(last_checked_str, "%Y-%m-%d").date()
-            age = (date.today() - last_checked).days
+            age = (today - date.fromisoformat(last_checked_str)).days
             if age < STALENESS_MAX_AGE_DAYS:
-                return cache.get("warnings", [])
+                warnings = cache.get("warnings", [])
+                _STALENESS_MEMO = (memo_key, warnings)
+                return list(warnings)
         except ValueError:
             pass
 
@@ -210,7 +329,7 @@ def fetch_remote_version(timeout: float = 2.0) -> Optional[dict]:
         from urllib.request import urlopen, Request
         req = Request(url, headers={"User-Agent": "jetbriefcheck"})
         with urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+            return json_compat.loads(resp.read())
     except Exception:
         return None
 
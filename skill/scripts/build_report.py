@@ -22,10 +22,24 @@ from pathlib import Path
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_DIR))
 
+from core import json_compat
 from core.models import BriefMetadata, BriefType, CheckResult, ComplianceReport, Recommendation, Severity
 from core.report_builder import build_html_report
 from core.version_check import get_version_stamp
 
+# Cover-page / filename patterns used by _extract_case_info
+_CASE_NUM_RE = re.compile(r"Supreme Court No\.?\s*(\d{8})", re.IGNORECASE)
+_BRIEF_LABEL_RE = re.compile(r"((?:AMENDED\s+)?(?:REPLY\s+)?BRIEF\s+OF\s+\S[^\n]{3,60})")
+_PLAINTIFF_RE = re.compile(
+    r"\n\s*([A-Z][a-zA-Z.\- ]+?)\s*,?\s*\)?\s*\n(?:\s*\)?\s*\n)*\s*(?:\)?\s*\n\s*)*Plaintiff"
+)
+_DEFENDANT_RE = re.compile(
+    r"vs\.?\s*\)?\s*\n(?:\s*\)?\s*\n)*\s*([A-Z][a-zA-Z.\- ]+?)\s*,?\s*\)?\s*\n"
+)
+_FILENAME_NUM_PREFIX_RE = re.compile(r"^\d+_")
+_BRIEF_SUFFIX_RE = re.compile(r"_(Apt|Ape|Apc|Ami|Rep)-?Br.*$", re.IGNORECASE)
+_V_ABBREV_RE = re.compile(r"\bv\b")
+
 
 def _extract_pages_from_message(message: str) -> list[int] | None:
     """Try to extract page numbers from a check message like 'Top Margin < 1" on 2, 3, 4'."""
@@ -70,20 +84,24 @@ def _parse_results(items: list[dict]) -> list[CheckResult]:
 
 def _hard_rule_recommendation(results: list[CheckResult]) -> tuple[Recommendation, str]:
     """Determine recommendation from severity levels (no API call)."""
-    failed = [r for r in results if r.failed]
-    has_reject = any(r.severity == Severity.REJECT for r in failed)
-    has_correction = any(r.severity == Severity.CORRECTION for r in failed)
-
-    if has_reject:
-        reject_checks = [r for r in failed if r.severity == Severity.REJECT]
+    reject_checks = []
+    correction_checks = []
+    for r in results:
+        if not r.failed:
+            continue
+        if r.severity is Severity.REJECT:
+            reject_checks.append(r)
+        elif r.severity is Severity.CORRECTION:
+            correction_checks.append(r)
+
+    if reject_checks:
         reasoning = (
             f"REJECT due to {len(reject_checks)} critical failure(s): "
             + "; ".join(f"{r.check_id} ({r.name})" for r in reject_checks)
         )
         return Recommendation.REJECT, reasoning
 
-    if has_correction:
-        correction_checks = [r for r in failed if r.severity == Severity.CORRECTION]
+    if correction_checks:
         reasoning = (
             f"Correction letter recommended due to {len(correction_checks)} issue(s): "
             + "; ".join(f"{r.check_id} ({r.name})" for r in correction_checks)
@@ -103,15 +121,12 @@ def _extract_case_info(cover_text: str, pdf_path: str) -> tuple[str, str, str]:
     brief_label = ""
 
     # Case number: look for "Supreme Court No. 20990001" or similar
-    m = re.search(r"Supreme Court No\.?\s*(\d{8})", cover_text, re.IGNORECASE)
+    m = _CASE_NUM_RE.search(cover_text)
     if m:
         case_number = m.group(1)
 
     # Brief label: look for "[AMENDED] BRIEF OF DEFENDANT-APPELLANT" etc. on one line
-    m = re.search(
-        r"((?:AMENDED\s+)?(?:REPLY\s+)?BRIEF\s+OF\s+\S[^\n]{3,60})",
-        cover_text,
-    )
+    m = _BRIEF_LABEL_RE.search(cover_text)
     if m:
         brief_label = m.group(1).strip().rstrip(",")
         # Title-case it for readability
@@ -122,11 +137,11 @@ def _extract_case_info(cover_text: str, pdf_path: str) -> tuple[str, str, str]:
     plaintiff = ""
     defendant = ""
     # Match the last non-empty, non-paren line before "Plaintiff"
-    m = re.search(r"\n\s*([A-Z][a-zA-Z.\- ]+?)\s*,?\s*\)?\s*\n(?:\s*\)?\s*\n)*\s*(?:\)?\s*\n\s*)*Plaintiff", cover_text)
+    m = _PLAINTIFF_RE.search(cover_text)
     if m:
         plaintiff = m.group(1).strip().rstrip(",")
     # Match the first name line after "vs."
-    m2 = re.search(r"vs\.?\s*\)?\s*\n(?:\s*\)?\s*\n)*\s*([A-Z][a-zA-Z.\- ]+?)\s*,?\s*\)?\s*\n", cover_text)
+    m2 = _DEFENDANT_RE.search(cover_text)
     if m2:
         defendant = m2.group(1).strip().rstrip(",")
 
@@ -137,12 +152,12 @@ def _extract_case_info(cover_text: str, pdf_path: str) -> tuple[str, str, str]:
         # Fallback: derive from PDF filename (e.g., "20990001_Example-Case_Apt-Br.pdf")
         stem = Path(pdf_path).stem
         # Strip leading case number
-        name_part = re.sub(r"^\d+_", "", stem)
+        name_part = _FILENAME_NUM_PREFIX_RE.sub("", stem)
         # Strip trailing brief-type suffix
-        name_part = re.sub(r"_(Apt|Ape|Apc|Ami|Rep)-?Br.*$", "", name_part, flags=re.IGNORECASE)
+        name_part = _BRIEF_SUFFIX_RE.sub("", name_part)
         # Convert hyphens to spaces, "v" to "v."
         name_part = name_part.replace("-", " ")
-        name_part = re.sub(r"\bv\b", "v.", name_part)
+        name_part = _V_ABBREV_RE.sub("v.", name_part)
         case_title = name_part.strip()
 
     return case_number, case_title, brief_label
@@ -168,12 +183,13 @@ def main():
         print(f"Error: Semantic file not found: {semantic_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Load intermediate (mechanical) data
-    intermediate = json.loads(intermediate_path.read_text(encoding="utf-8"))
+    # Load intermediate (mechanical) data. Stdlib json, not json_compat: the
+    # text fields may carry lone-surrogate escapes, which orjson rejects.
+    intermediate = json.loads(intermediate_path.read_bytes())
     mech_results = _parse_results(intermediate["mechanical_results"])
 
     # Load semantic results
-    semantic_data = json.loads(semantic_path.read_text(encoding="utf-8"))
+    semantic_data = json_compat.loads(semantic_path.read_bytes())
     sem_results = _parse_results(semantic_data["semantic_results"])
 
     # Merge all results
@@ -223,7 +239,7 @@ def main():
 
     report_filename = f"{pdf_source.stem}-compliance.html"
     report_path = output_dir / report_filename
-    report_path.write_text(html, encoding="utf-8")
+    report_path.write_bytes(html.encode("utf-8"))
 
     print(f"Report saved: {report_path}", file=sys.stderr)
 
@@ -249,7 +265,7 @@ def main():
             for r in report.failed_checks
         ],
     }
-    print(json.dumps(summary, indent=2))
+    print(json_compat.dumps(summary, indent=True))
 
 
 if __name__ == "__main__":
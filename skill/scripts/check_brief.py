@@ -8,14 +8,20 @@ Usage:
     # Mechanical-only mode (no API calls, outputs intermediate JSON):
     python check_brief.py <path-to-pdf> --mechanical-only [--brief-type TYPE] [--output-dir DIR]
 
+    # Batch mode: several PDFs and/or directories of PDFs in one process
+    python check_brief.py <dir-or-pdf> [<dir-or-pdf> ...] [options]
+
 Imports the core engine from the web app project and runs the analysis pipeline.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
+import pickle
+import stat
 import sys
 from pathlib import Path
 
@@ -23,53 +29,186 @@ from pathlib import Path
 PROJECT_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_DIR))
 
+from core import json_compat
 from core.brief_classifier import classify_brief
 from core.checks_mechanical import run_mechanical_checks
 from core.models import BriefType
 from core.pdf_extract import extract_brief
-from core.version_check import get_version_warnings
+from core.version_check import get_version_warnings, load_local_version
 from check_update import check_for_update
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Check appellate brief PDF for compliance.")
-    parser.add_argument("pdf", help="Path to the PDF file")
-    parser.add_argument("--brief-type", default="auto",
-                        choices=["auto", "appellant", "appellee", "reply", "cross_appeal", "amicus", "petition_rehearing"],
-                        help="Brief type (default: auto-detect)")
-    parser.add_argument("--output-dir", default=None,
-                        help="Directory for output files (default: same as PDF)")
-    parser.add_argument("--no-semantic", action="store_true",
-                        help="Skip semantic (Claude API) checks")
-    parser.add_argument("--mechanical-only", action="store_true",
-                        help="Run only extraction + mechanical checks; dump intermediate JSON (no API calls)")
-    parser.add_argument("--model", default=None,
-                        help="Claude model to use (default: from env or claude-sonnet-4-6)")
-    parser.add_argument("--skip-version-check", action="store_true",
-                        help="Skip remote version check")
-    args = parser.parse_args()
+# Pickled BriefMetadata lives in a private per-user directory, never in the
+# report output directory. Bump _METADATA_CACHE_VERSION when extraction changes.
+_METADATA_CACHE_DIR = Path.home() / ".cache" / "jetbriefcheck" / "metadata"
+_METADATA_CACHE_VERSION = 1
 
-    # Update check (cached, weekly)
-    update_msg = check_for_update()
-    if update_msg:
-        print(f"Note: {update_msg}", file=sys.stderr)
 
-    # Rule freshness warnings
-    warnings = get_version_warnings(check_remote=not args.skip_version_check)
-    for w in warnings:
-        print(f"Warning: {w}", file=sys.stderr)
+def _metadata_cache_path(pdf_path: Path, text_only_addendum: bool) -> Path:
+    """Cache file for a PDF's extracted metadata.
 
-    pdf_path = Path(args.pdf).resolve()
-    if not pdf_path.exists():
-        print(f"Error: File not found: {pdf_path}", file=sys.stderr)
-        sys.exit(1)
+    Keyed on the PDF content plus the extractor version, the skill version and
+    the metadata field names, so an upgrade never reuses an incompatible pickle.
+    """
+    from dataclasses import fields
+
+    from core.models import BriefMetadata, PageInfo
+
+    h = hashlib.sha256()
+    h.update(repr((
+        _METADATA_CACHE_VERSION,
+        load_local_version().get("version", ""),
+        [f.name for f in fields(BriefMetadata)],
+        [f.name for f in fields(PageInfo)],
+        text_only_addendum,
+    )).encode())
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return _METADATA_CACHE_DIR / f"{h.hexdigest()}.pkl"
+
+
+def _load_metadata(pdf_path: Path, text_only_addendum: bool, use_cache: bool):
+    """Extract the PDF, reusing a pickled BriefMetadata from an earlier run if present."""
+    if not use_cache:
+        return extract_brief(pdf_path, text_only_addendum=text_only_addendum)
+
+    cache_path = _metadata_cache_path(pdf_path, text_only_addendum)
+    try:
+        with open(cache_path, "rb") as f:
+            metadata = pickle.load(f)
+        print("Using cached PDF metadata.", file=sys.stderr)
+        return metadata
+    except Exception:
+        pass  # missing, stale or unreadable cache entry; re-extract below
+
+    metadata = extract_brief(pdf_path, text_only_addendum=text_only_addendum)
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(metadata, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return metadata
+
+
+def _recommend(all_results, output_dir: Path, use_cache: bool, loop=None, client=None, **kwargs):
+    """compute_recommendation, reusing an earlier Claude-weighted result for identical findings.
+
+    With *loop* and *client* the weighting call goes through the run's shared
+    AsyncAnthropic client.  Only weighted recommendations are cached (the
+    hard-rule pass is cheap); entries live in OUTPUT_DIR/.cache/recommendations.json
+    keyed by a hash of the model and every check result.
+    """
+    from core.models import Recommendation
+    from core.recommender import compute_recommendation, compute_recommendation_async
 
-    output_dir = Path(args.output_dir) if args.output_dir else pdf_path.parent
+    def compute():
+        if client is not None:
+            return loop.run_until_complete(
+                compute_recommendation_async(all_results, client=client, **kwargs)
+            )
+        return compute_recommendation(all_results, **kwargs)
+
+    if not (use_cache and kwargs.get("use_claude_weighting")):
+        return compute()
+
+    h = hashlib.sha256(kwargs.get("model", "").encode())
+    for r in all_results:
+        h.update(repr((r.check_id, r.passed, r.severity.value, r.message,
+                       r.details, r.applicable, r.rule)).encode())
+    key = h.hexdigest()
+
+    cache_path = output_dir / ".cache" / "recommendations.json"
+    try:
+        cached = json_compat.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        cached = {}
+    if key in cached:
+        rec_value, reasoning = cached[key]
+        print("Using cached recommendation.", file=sys.stderr)
+        return Recommendation(rec_value), reasoning
+
+    recommendation, reasoning = compute()
+    if not reasoning.startswith("Claude weighting unavailable"):
+        cached[key] = [recommendation.value, reasoning]
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            cache_path.write_text(json_compat.dumps(cached), encoding="utf-8")
+        except OSError:
+            pass
+    return recommendation, reasoning
+
+
+def _write_json_string(f, text: str, chunk_size: int = 65536) -> None:
+    """Write *text* as a JSON string literal in slices, without one big escaped copy."""
+    encode = json.encoder.encode_basestring_ascii
+    f.write('"')
+    for i in range(0, len(text), chunk_size):
+        f.write(encode(text[i:i + chunk_size])[1:-1])
+    f.write('"')
+
+
+def _write_intermediate(out_path: Path, header: dict, metadata, mech_results) -> None:
+    """Stream the --mechanical-only intermediate JSON to *out_path*.
+
+    The cover and full text can be large, so they are escaped and written in
+    chunks rather than building the whole document as one string first.
+    """
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for key, value in header.items():
+            f.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+        for key in ("cover_text", "full_text"):
+            f.write(f'  "{key}": ')
+            _write_json_string(f, getattr(metadata, key))
+            f.write(",\n")
+        f.write('  "mechanical_results": [')
+        for i, r in enumerate(mech_results):
+            f.write("," if i else "")
+            f.write("\n    " + json.dumps(r.to_public_dict(), indent=2).replace("\n", "\n    "))
+        f.write("\n  ]\n}\n" if mech_results else "]\n}\n")
+
+
+# Smaller model for --latency-optimized; only used for the recommendation
+# weighting pass, whose prompt is a short list of findings.
+FAST_MODEL = "claude-haiku-4-5"
+
+
+def _resolved_path(arg: str) -> Path:
+    """argparse type: resolve once at parse time."""
+    return Path(arg).resolve()
+
+
+def _collect_pdfs(paths: list[Path]) -> tuple[list[Path], bool]:
+    """Expand the command-line paths: directories contribute their *.pdf files.
+
+    Returns (pdfs, batch), where batch is true for several paths or any directory.
+    """
+    pdfs = []
+    batch = len(paths) > 1
+    for path in paths:
+        try:
+            is_dir = stat.S_ISDIR(path.stat().st_mode)
+        except FileNotFoundError:
+            print(f"Error: File not found: {path}", file=sys.stderr)
+            sys.exit(1)
+        if is_dir:
+            pdfs.extend(sorted(path.glob("*.pdf")))
+            batch = True
+        else:
+            pdfs.append(path)
+    return pdfs, batch
+
+
+def _prepare(pdf_path: Path, args):
+    """Extract and classify one PDF; returns (metadata, output_dir)."""
+    output_dir = args.output_dir or pdf_path.parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Extract
     print("Extracting PDF metadata...", file=sys.stderr)
-    metadata = extract_brief(pdf_path)
+    metadata = _load_metadata(pdf_path, args.text_only_addendum, args.cache)
 
     # Classify
     if args.brief_type != "auto":
@@ -77,73 +216,153 @@ def main():
     else:
         metadata.brief_type = classify_brief(metadata)
     print(f"Brief type: {metadata.brief_type.value}", file=sys.stderr)
+    return metadata, output_dir
+
+
+def _extract_and_check(pdf_path: Path, args):
+    """Extract, classify and mechanically check one PDF.
 
-    # Mechanical checks
+    Returns (metadata, output_dir, mech_results).  Module-level so batch mode
+    can run it in worker processes.
+    """
+    metadata, output_dir = _prepare(pdf_path, args)
     print("Running mechanical checks...", file=sys.stderr)
-    mech_results = run_mechanical_checks(metadata)
+    return metadata, output_dir, run_mechanical_checks(metadata)
 
-    # --- Mechanical-only mode: dump intermediate JSON and exit ---
-    if args.mechanical_only:
-        intermediate = {
-            "pdf_path": str(pdf_path),
-            "brief_type": metadata.brief_type.value,
-            "total_pages": metadata.total_pages,
-            "body_pages": metadata.body_pages,
-            "word_count": metadata.word_count,
-            "cover_text": metadata.cover_text,
-            "full_text": metadata.full_text,
-            "mechanical_results": [
-                {
-                    "check_id": r.check_id,
-                    "name": r.name,
-                    "rule": r.rule,
-                    "passed": r.passed,
-                    "severity": r.severity.value,
-                    "message": r.message,
-                    "details": r.details,
-                    "applicable": r.applicable,
-                }
-                for r in mech_results
-            ],
+
+def _batch_jobs(pdf_paths: list[Path], args):
+    """Run _extract_and_check for each PDF in a process pool.
+
+    Yields (index, pdf_path, outcome) as each brief finishes, where outcome is
+    the _extract_and_check result or the exception it raised.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # forkserver avoids copying this process into every worker where available
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+    workers = min(len(pdf_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+        futures = {
+            ex.submit(_extract_and_check, pdf_path, args): (i, pdf_path)
+            for i, pdf_path in enumerate(pdf_paths)
         }
-        out_path = output_dir / f"{pdf_path.stem}-intermediate.json"
-        out_path.write_text(json.dumps(intermediate, indent=2), encoding="utf-8")
-        print(f"Intermediate JSON saved: {out_path}", file=sys.stderr)
-        # Print the path to stdout so the caller can capture it
-        print(str(out_path))
-        return
+        for fut in as_completed(futures):
+            i, pdf_path = futures[fut]
+            try:
+                outcome = fut.result()
+            except Exception as e:
+                outcome = e
+            yield i, pdf_path, outcome
+
+
+def _serial_jobs(pdf_paths: list[Path]):
+    """Same shape as _batch_jobs, leaving extraction to the per-brief runner."""
+    for i, pdf_path in enumerate(pdf_paths):
+        yield i, pdf_path, None
+
+
+def _jobs(pdf_paths: list[Path], args):
+    """Job iterator for *pdf_paths*: a process pool for several PDFs, in-process for one."""
+    return _batch_jobs(pdf_paths, args) if len(pdf_paths) > 1 else _serial_jobs(pdf_paths)
+
+
+def _intermediate_path(pdf_path: Path, args) -> Path:
+    """Where --mechanical-only writes the intermediate JSON for *pdf_path*."""
+    return (args.output_dir or pdf_path.parent) / f"{pdf_path.stem}-intermediate.json"
+
+
+def _intermediate_options(args) -> dict:
+    """Options that shape the intermediate JSON, recorded in its header."""
+    return {
+        "skill_version": load_local_version().get("version", ""),
+        "brief_type": args.brief_type,
+        "text_only_addendum": args.text_only_addendum,
+    }
+
+
+def _intermediate_is_current(pdf_path: Path, args) -> bool:
+    """True if the intermediate JSON is as new as the PDF and records this run's options."""
+    out_path = _intermediate_path(pdf_path, args)
+    try:
+        if out_path.stat().st_mtime < pdf_path.stat().st_mtime:
+            return False
+        options = json.loads(out_path.read_bytes()).get("options")
+    except (OSError, ValueError, AttributeError):
+        return False
+    return options == _intermediate_options(args)
+
+
+def _run_mechanical_only(pdf_path: Path, args, prepared=None) -> Path:
+    """Extract + mechanical checks for one PDF; writes and returns the intermediate JSON path.
+
+    *prepared* is an _extract_and_check result computed elsewhere (batch mode).
+    """
+    metadata, output_dir, mech_results = prepared or _extract_and_check(pdf_path, args)
+    header = {
+        "pdf_path": str(pdf_path),
+        "brief_type": metadata.brief_type.value,
+        "total_pages": metadata.total_pages,
+        "body_pages": metadata.body_pages,
+        "word_count": metadata.word_count,
+        "options": _intermediate_options(args),
+    }
+    out_path = _intermediate_path(pdf_path, args)
+    _write_intermediate(out_path, header, metadata, mech_results)
+    print(f"Intermediate JSON saved: {out_path}", file=sys.stderr)
+    return out_path
+
+
+def _run_full(
+    pdf_path: Path, args, api_key: str, model: str, loop=None, client=None, prepared=None,
+) -> dict:
+    """Full pipeline for one PDF; writes the HTML report and returns the JSON summary.
+
+    *loop* and *client* are the shared event loop and AsyncAnthropic client,
+    or None when semantic checks are not being run.  *prepared* is an
+    _extract_and_check result computed elsewhere (batch mode); otherwise the
+    mechanical checks run alongside the semantic API call.
+    """
+    import uuid
 
-    # --- Full pipeline (original behavior) ---
-    # These imports require anthropic SDK; deferred so --mechanical-only works without it
-    from core.checks_semantic import run_semantic_checks
     from core.models import ComplianceReport
-    from core.recommender import compute_recommendation
     from core.report_builder import build_html_report
     from core.version_check import get_version_stamp
 
-    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    model = args.model or os.environ.get("CLAUDE_MODEL", "claude-sonnet-4-6")
+    # Mechanical + semantic checks
+    if prepared is not None:
+        metadata, output_dir, all_results = prepared
+        if client is not None:
+            from core.checks_semantic import run_semantic_checks_async
 
-    # Semantic checks
-    sem_results = []
-    if not args.no_semantic:
-        if not api_key:
-            print("Warning: ANTHROPIC_API_KEY not set; skipping semantic checks.", file=sys.stderr)
-        else:
             print("Running semantic checks (Claude API)...", file=sys.stderr)
-            sem_results = run_semantic_checks(metadata, api_key=api_key, model=model)
+            all_results = all_results + loop.run_until_complete(run_semantic_checks_async(
+                metadata, api_key=api_key, model=model, cache=not args.no_prompt_cache,
+                client=client,
+            ))
+    elif client is not None:
+        from core.checks import run_all_checks_async
 
-    all_results = mech_results + sem_results
+        metadata, output_dir = _prepare(pdf_path, args)
+        print("Running mechanical and semantic checks (Claude API)...", file=sys.stderr)
+        all_results = loop.run_until_complete(run_all_checks_async(
+            metadata, api_key=api_key, model=model, cache=not args.no_prompt_cache,
+            client=client,
+        ))
+    else:
+        metadata, output_dir, all_results = _extract_and_check(pdf_path, args)
 
     # Recommendation
     print("Computing recommendation...", file=sys.stderr)
     use_claude = bool(api_key) and not args.no_semantic
-    recommendation, reasoning = compute_recommendation(
-        all_results, api_key=api_key, model=model, use_claude_weighting=use_claude,
+    weighting_model = FAST_MODEL if args.latency_optimized else model
+    recommendation, reasoning = _recommend(
+        all_results, output_dir, args.cache, loop, client,
+        api_key=api_key, model=weighting_model, use_claude_weighting=use_claude,
     )
 
     # Build report
-    import uuid
     report = ComplianceReport(
         brief_type=metadata.brief_type,
         recommendation=recommendation,
@@ -157,11 +376,10 @@ def main():
     pdf_stem = pdf_path.stem
     report_filename = f"compliance-{pdf_stem}-{report.report_id}.html"
     report_path = output_dir / report_filename
-    report_path.write_text(html, encoding="utf-8")
+    report_path.write_bytes(html.encode("utf-8"))
     print(f"Report saved: {report_path}", file=sys.stderr)
 
-    # JSON summary to stdout
-    summary = {
+    return {
         "report_id": report.report_id,
         "report_path": str(report_path),
         "pdf_path": str(pdf_path),
@@ -182,7 +400,131 @@ def main():
             for r in report.failed_checks
         ],
     }
-    print(json.dumps(summary, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check appellate brief PDF for compliance.")
+    parser.add_argument("pdf", nargs="+", type=_resolved_path,
+                        help="Path to the PDF file (several files or directories of PDFs run as a batch)")
+    parser.add_argument("--brief-type", default="auto",
+                        choices=["auto", "appellant", "appellee", "reply", "cross_appeal", "amicus", "petition_rehearing"],
+                        help="Brief type (default: auto-detect)")
+    parser.add_argument("--output-dir", default=None, type=_resolved_path,
+                        help="Directory for output files (default: same as PDF)")
+    parser.add_argument("--no-semantic", action="store_true",
+                        help="Skip semantic (Claude API) checks")
+    parser.add_argument("--mechanical-only", action="store_true",
+                        help="Run only extraction + mechanical checks; dump intermediate JSON (no API calls)")
+    parser.add_argument("--force", action="store_true",
+                        help="With --mechanical-only, rerun even if the intermediate JSON is up to date")
+    parser.add_argument("--model", default=None,
+                        help="Claude model to use (default: from env or claude-sonnet-4-6)")
+    parser.add_argument("--latency-optimized", action="store_true",
+                        help=f"Use {FAST_MODEL} for the short recommendation-weighting call")
+    parser.add_argument("--skip-version-check", action="store_true",
+                        help="Skip remote version check")
+    parser.add_argument("--text-only-addendum", action="store_true",
+                        help="Read addendum pages for text only (faster; their layout is not checked)")
+    parser.add_argument("--cache", action=argparse.BooleanOptionalAction, default=False,
+                        help="Reuse extracted PDF metadata (cached in ~/.cache/jetbriefcheck) and "
+                             "recommendations (OUTPUT_DIR/.cache) from earlier runs (default: off)")
+    parser.add_argument("--no-prompt-cache", action="store_true",
+                        help="Do not mark the rule and brief text for Claude prompt caching")
+    args = parser.parse_args()
+
+    # Update check (cached, weekly)
+    update_msg = check_for_update()
+    if update_msg:
+        print(f"Note: {update_msg}", file=sys.stderr)
+
+    # Rule freshness warnings
+    warnings = get_version_warnings(check_remote=not args.skip_version_check)
+    for w in warnings:
+        print(f"Warning: {w}", file=sys.stderr)
+
+    pdf_paths, batch = _collect_pdfs(args.pdf)
+    if not pdf_paths:
+        print("Error: No PDF files found.", file=sys.stderr)
+        sys.exit(1)
+
+    # --- Mechanical-only mode: dump intermediate JSON and exit ---
+    if args.mechanical_only:
+        # Output paths by input position, so stdout follows the input order
+        # however the batch jobs finish.
+        out_paths: list = [None] * len(pdf_paths)
+        stale = []  # (input index, pdf_path)
+        for i, pdf_path in enumerate(pdf_paths):
+            # Skip PDFs whose intermediate JSON is newer than the PDF and was
+            # written by this version with the same options
+            if not args.force and _intermediate_is_current(pdf_path, args):
+                print(f"Intermediate JSON up to date: {pdf_path.name}", file=sys.stderr)
+                out_paths[i] = _intermediate_path(pdf_path, args)
+            else:
+                stale.append((i, pdf_path))
+
+        failed = False
+        for j, pdf_path, prepared in _jobs([p for _, p in stale], args):
+            if isinstance(prepared, Exception):
+                print(f"Error: {pdf_path}: {prepared}", file=sys.stderr)
+                failed = True
+                continue
+            out_paths[stale[j][0]] = _run_mechanical_only(pdf_path, args, prepared)
+
+        # Print the paths to stdout so the caller can capture them
+        for out_path in out_paths:
+            if out_path is not None:
+                print(str(out_path))
+        if failed:
+            sys.exit(1)
+        return
+
+    # --- Full pipeline (original behavior) ---
+    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+    model = args.model or os.environ.get("CLAUDE_MODEL", "claude-sonnet-4-6")
+
+    if not args.no_semantic and not api_key:
+        print("Warning: ANTHROPIC_API_KEY not set; skipping semantic checks.", file=sys.stderr)
+
+    # One event loop and API client for every Claude call in the run (semantic
+    # checks and recommendation weighting, across all briefs in batch mode),
+    # so they share one connection pool.  These imports require anthropic SDK;
+    # deferred so --mechanical-only works without it.
+    loop = client = None
+    if not args.no_semantic and api_key:
+        import asyncio
+
+        import anthropic
+
+        loop = asyncio.new_event_loop()
+        client = anthropic.AsyncAnthropic(api_key=api_key)
+
+    summaries: list = [None] * len(pdf_paths)
+    failed = False
+    try:
+        for i, pdf_path, prepared in _jobs(pdf_paths, args):
+            if batch:
+                print(f"=== {pdf_path.name} ===", file=sys.stderr)
+            try:
+                if isinstance(prepared, Exception):
+                    raise prepared
+                summaries[i] = _run_full(
+                    pdf_path, args, api_key, model, loop, client, prepared=prepared,
+                )
+            except Exception as e:
+                if not batch:
+                    raise
+                print(f"Error: {pdf_path}: {e}", file=sys.stderr)
+                summaries[i] = {"pdf_path": str(pdf_path), "error": str(e)}
+                failed = True
+    finally:
+        if loop is not None:
+            loop.run_until_complete(client.close())
+            loop.close()
+
+    # JSON summary to stdout (a list of summaries in batch mode)
+    print(json.dumps(summaries if batch else summaries[0], indent=2))
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -15,14 +15,12 @@ Covers:
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
+import dataclasses
+import re
 
 import pytest
 
-PROJECT_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_DIR / "skill"))
-
+# skill/ is put on sys.path once per session by the root conftest.py.
 from core.constants import FONT_NONCOMPLIANT_THRESHOLD, FONT_SIZE_TOLERANCE, MIN_FONT_SIZE_PT
 from core.checks_mechanical import (
     _check_font_size_per_page,
@@ -36,106 +34,146 @@ from core.models import BriefMetadata, PageInfo, Severity
 # Helpers
 # ---------------------------------------------------------------------------
 
+@dataclasses.dataclass(frozen=True)
+class _FontSpan:
+    """One span in the shape PageInfo.fonts expects; converted to a dict per page."""
+    name: str = "TimesNewRoman"
+    size: float = 0.0
+    flags: int = 0
+    chars: int = 20
+    origin_y: float = 400.0
+    text: str = ""
+
+
 def _make_font(size: float, chars: int = 20, origin_y: float = 400.0,
                flags: int = 0, name: str = "TimesNewRoman",
-               text: str = "") -> dict:
-    return {"name": name, "size": size, "flags": flags,
-            "chars": chars, "origin_y": origin_y, "text": text}
+               text: str = "") -> _FontSpan:
+    return _FontSpan(name=name, size=size, flags=flags,
+                     chars=chars, origin_y=origin_y, text=text)
+
+
+def _font_dict(*args, **kwargs) -> dict:
+    """A span as the raw dict the classification helpers take."""
+    return dataclasses.asdict(_make_font(*args, **kwargs))
+
+
+# Shared anchor spans. They are frozen, so one instance can back many pages.
+_BODY_500 = _make_font(12.0, chars=500, origin_y=400.0)
+_BODY_800 = _make_font(12.0, chars=800, origin_y=400.0)
+_BODY_13PT_500 = _make_font(13.0, chars=500, origin_y=400.0)
+_FOOTER_3 = _make_font(10.0, chars=3, origin_y=750.0)
+_SMALL_BODY_15 = _make_font(10.0, chars=15, origin_y=400.0)
+
+
+_TEMPLATE_PAGE = PageInfo(
+    page_number=0,
+    width_inches=8.5,
+    height_inches=11.0,
+    left_margin_inches=1.5,
+    right_margin_inches=1.0,
+    top_margin_inches=1.0,
+    bottom_margin_inches=1.0,
+    fonts=[],
+    text="",
+)
 
 
-def _make_page(page_number: int, fonts: list[dict],
+def _make_page(page_number: int, fonts: list[_FontSpan],
                height_inches: float = 11.0, text: str = "") -> PageInfo:
-    return PageInfo(
+    return dataclasses.replace(
+        _TEMPLATE_PAGE,
         page_number=page_number,
-        width_inches=8.5,
         height_inches=height_inches,
-        left_margin_inches=1.5,
-        right_margin_inches=1.0,
-        top_margin_inches=1.0,
-        bottom_margin_inches=1.0,
-        fonts=fonts,
+        fonts=[dataclasses.asdict(f) for f in fonts],
         text=text,
     )
 
 
 def _make_metadata(pages: list[PageInfo],
                    predominant_font_size: float = 12.0) -> BriefMetadata:
-    all_sizes = [f["size"] for p in pages for f in p.fonts if f["size"] > 0]
+    min_size = min((f["size"] for p in pages for f in p.fonts if f["size"] > 0),
+                   default=None)
     return BriefMetadata(
         pages=pages,
-        min_font_size=min(all_sizes) if all_sizes else None,
+        min_font_size=min_size,
         predominant_font_size=predominant_font_size,
     )
 
 
-# ---------------------------------------------------------------------------
-# _classify_font_span tests
-# ---------------------------------------------------------------------------
+def _run_check(pages: list[PageInfo], predominant_font_size: float = 12.0):
+    return _check_font_size_per_page(_make_metadata(pages, predominant_font_size))
 
-class TestClassifyFontSpan:
-    """Unit tests for the span classification helper."""
-
-    def test_body_text(self):
-        font = _make_font(size=10.0, origin_y=400.0, chars=30)
-        assert _classify_font_span(font, 792.0) == "body"
 
-    def test_top_header_zone(self):
-        # origin_y at 50pt on an 11-inch (792pt) page → 6.3% from top
-        font = _make_font(size=10.0, origin_y=50.0, chars=30)
-        assert _classify_font_span(font, 792.0) == "header_footer"
+@pytest.fixture
+def run_check(request):
+    """Indirect fixture: ``request.param`` is ``(pages, predominant_font_size)``."""
+    pages, predominant = request.param
+    return _run_check(pages, predominant)
 
-    def test_bottom_footer_zone(self):
-        # origin_y at 750pt on 792pt page → 94.7% from top
-        font = _make_font(size=10.0, origin_y=750.0, chars=30)
-        assert _classify_font_span(font, 792.0) == "header_footer"
 
-    def test_superscript_flag(self):
-        # bit 0 set → superscript, even if in body zone
-        font = _make_font(size=8.0, origin_y=400.0, chars=2, flags=1)
-        assert _classify_font_span(font, 792.0) == "superscript"
-
-    def test_short_digit_text_as_superscript(self):
-        # <=4 chars, small size, no superscript flag → still superscript
-        font = _make_font(size=8.0, origin_y=400.0, chars=2, flags=0)
-        assert _classify_font_span(font, 792.0) == "superscript"
-
-    def test_short_text_compliant_size_is_body(self):
-        # <=4 chars but size is compliant → doesn't trigger superscript path
-        # (won't be called for compliant spans in practice, but test the logic)
-        font = _make_font(size=12.0, origin_y=400.0, chars=2, flags=0)
-        assert _classify_font_span(font, 792.0) == "body"
+# ---------------------------------------------------------------------------
+# _classify_font_span tests
+# ---------------------------------------------------------------------------
 
-    def test_header_footer_takes_priority_over_superscript(self):
-        # In footer zone AND superscript flag set → header_footer wins
-        font = _make_font(size=8.0, origin_y=760.0, chars=2, flags=1)
-        assert _classify_font_span(font, 792.0) == "header_footer"
-
-    def test_boundary_top_zone(self):
-        # Exactly at 10% boundary
-        font = _make_font(size=10.0, origin_y=79.2, chars=10)
-        assert _classify_font_span(font, 792.0) == "header_footer"
-
-    def test_just_inside_body_from_top(self):
-        # Just past 10% boundary
-        font = _make_font(size=10.0, origin_y=80.0, chars=10)
-        # 80 > 79.2 and 80 < 712.8 → body (but small size + <=4 chars check)
-        # chars=10, so not caught by short-text rule → body
-        assert _classify_font_span(font, 792.0) == "body"
+CLASSIFY_CASES = [
+    pytest.param(dict(size=10.0, origin_y=400.0, chars=30), None, 792.0, "body",
+                 id="body_text"),
+    # origin_y at 50pt on an 11-inch (792pt) page → 6.3% from top
+    pytest.param(dict(size=10.0, origin_y=50.0, chars=30), None, 792.0, "header_footer",
+                 id="top_header_zone"),
+    # origin_y at 750pt on 792pt page → 94.7% from top
+    pytest.param(dict(size=10.0, origin_y=750.0, chars=30), None, 792.0, "header_footer",
+                 id="bottom_footer_zone"),
+    # bit 0 set → superscript, even if in body zone
+    pytest.param(dict(size=8.0, origin_y=400.0, chars=2, flags=1), None, 792.0, "superscript",
+                 id="superscript_flag"),
+    # <=4 chars, small size, no superscript flag → still superscript
+    pytest.param(dict(size=8.0, origin_y=400.0, chars=2, flags=0), None, 792.0, "superscript",
+                 id="short_digit_text_as_superscript"),
+    # <=4 chars but size is compliant → doesn't trigger superscript path
+    # (won't be called for compliant spans in practice, but test the logic)
+    pytest.param(dict(size=12.0, origin_y=400.0, chars=2, flags=0), None, 792.0, "body",
+                 id="short_text_compliant_size_is_body"),
+    # In footer zone AND superscript flag set → header_footer wins
+    pytest.param(dict(size=8.0, origin_y=760.0, chars=2, flags=1), None, 792.0, "header_footer",
+                 id="header_footer_takes_priority_over_superscript"),
+    # Exactly at 10% boundary
+    pytest.param(dict(size=10.0, origin_y=79.2, chars=10), None, 792.0, "header_footer",
+                 id="boundary_top_zone"),
+    # Just past 10% boundary: 80 > 79.2 and 80 < 712.8 → body
+    # (chars=10, so not caught by short-text rule)
+    pytest.param(dict(size=10.0, origin_y=80.0, chars=10), None, 792.0, "body",
+                 id="just_inside_body_from_top"),
+]
+
+
+@pytest.mark.parametrize("font_kwargs,predominant,height,expected", CLASSIFY_CASES)
+def test_classify(font_kwargs, predominant, height, expected):
+    """Unit tests for the span classification helper."""
+    font = _font_dict(**font_kwargs)
+    assert _classify_font_span(font, height, predominant_size=predominant) == expected
 
 
 # ---------------------------------------------------------------------------
 # _check_font_size_per_page tests
 # ---------------------------------------------------------------------------
 
+# Tests that look for three or more substrings in one details string match
+# them in a single pass.
+_MIXED_CATEGORIES_RE = re.compile(
+    r"(?s)(?=.*20 body)(?=.*5 header/footer)(?=.*2 superscript)(?=.*27 of 827 chars)"
+)
+
+
 class TestFontSizePerPage:
     """Integration tests for the FMT-006 per-page check."""
 
     def test_all_compliant_passes(self):
         pages = [
-            _make_page(0, [_make_font(12.0, chars=500)]),
+            _make_page(0, [_BODY_500]),
             _make_page(1, [_make_font(12.5, chars=800)]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is True
         assert result.check_id == "FMT-006"
         assert result.severity == Severity.REJECT
@@ -143,23 +181,23 @@ class TestFontSizePerPage:
     def test_font_at_tolerance_boundary_passes(self):
         # 12.0 - 0.3 = 11.7; font at exactly 11.7 should pass
         pages = [_make_page(0, [_make_font(11.7, chars=500)])]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is True
 
     def test_font_just_below_tolerance_fails(self):
         pages = [_make_page(0, [_make_font(11.6, chars=500)])]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is False
 
     def test_noncompliant_body_text_reject(self):
         """>=10 noncompliant body chars on a page → REJECT severity."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
-                _make_font(10.0, chars=15, origin_y=400.0),  # body, nc
+                _BODY_500,
+                _SMALL_BODY_15,  # body, nc
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is False
         assert result.severity == Severity.REJECT
         assert "page 1" in result.message
@@ -170,11 +208,11 @@ class TestFontSizePerPage:
         """<10 noncompliant chars on every page → NOTE severity."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
+                _BODY_500,
                 _make_font(10.0, chars=5, origin_y=400.0),  # body, nc but <10
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is False
         assert result.severity == Severity.NOTE
         assert "page 1" in result.message
@@ -183,12 +221,12 @@ class TestFontSizePerPage:
         """Noncompliant chars only in footer zone → PASS with note."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
+                _BODY_500,
                 # Footer zone: origin_y=750 on 11-inch (792pt) page
-                _make_font(10.0, chars=3, origin_y=750.0),
+                _FOOTER_3,
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is True
         assert "headers/footers" in result.details
 
@@ -196,12 +234,12 @@ class TestFontSizePerPage:
         """Noncompliant chars in footer + body → FAIL with header/footer label."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
-                _make_font(10.0, chars=3, origin_y=750.0),     # footer
-                _make_font(10.0, chars=15, origin_y=400.0),    # body
+                _BODY_500,
+                _FOOTER_3,       # footer
+                _SMALL_BODY_15,  # body
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is False
         assert "header/footer" in result.details
         assert "body" in result.details
@@ -210,11 +248,11 @@ class TestFontSizePerPage:
         """Noncompliant chars only superscript → PASS with note."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
+                _BODY_500,
                 _make_font(8.0, chars=2, origin_y=400.0, flags=1),  # superscript
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is True
         assert "superscripts" in result.details
 
@@ -222,11 +260,11 @@ class TestFontSizePerPage:
         """Short small-font text (<=4 chars, no flag) → superscript → PASS."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
+                _BODY_500,
                 _make_font(9.0, chars=3, origin_y=400.0, flags=0),
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is True
         assert "superscripts" in result.details
 
@@ -234,33 +272,30 @@ class TestFontSizePerPage:
         """Body + header/footer + superscript all on one page."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=800, origin_y=400.0),
+                _BODY_800,
                 _make_font(10.0, chars=20, origin_y=400.0),   # body
                 _make_font(10.0, chars=5, origin_y=750.0),     # footer
                 _make_font(8.0, chars=2, origin_y=400.0, flags=1),  # superscript
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is False
         assert result.severity == Severity.REJECT  # 27 total >= 10
-        assert "20 body" in result.details
-        assert "5 header/footer" in result.details
-        assert "2 superscript" in result.details
-        assert "27 of 827 chars" in result.details
+        assert _MIXED_CATEGORIES_RE.search(result.details)
 
     def test_multiple_pages_mixed(self):
         """Two pages: one serious, one minor."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
+                _BODY_500,
                 _make_font(10.0, chars=50, origin_y=400.0),   # 50 body nc → REJECT
             ]),
             _make_page(1, [
                 _make_font(12.0, chars=600, origin_y=400.0),
-                _make_font(10.0, chars=3, origin_y=750.0),    # 3 footer nc
+                _FOOTER_3,  # 3 footer nc
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is False
         assert result.severity == Severity.REJECT  # page 0 has 50 >= 10
         assert "Page 1" in result.details
@@ -270,15 +305,15 @@ class TestFontSizePerPage:
         """All noncompliant chars are header/footer or superscript → PASS."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
-                _make_font(10.0, chars=3, origin_y=750.0),       # header/footer
+                _BODY_500,
+                _FOOTER_3,  # header/footer
             ]),
             _make_page(1, [
                 _make_font(12.0, chars=600, origin_y=400.0),
                 _make_font(9.0, chars=2, origin_y=400.0, flags=1),  # superscript
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is True
         assert "headers/footers" in result.details
         assert "superscripts" in result.details
@@ -288,11 +323,11 @@ class TestFontSizePerPage:
             _make_page(0, []),
             _make_page(1, [_make_font(12.0, chars=200)]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert result.passed is True
 
     def test_empty_pages_list(self):
-        result = _check_font_size_per_page(_make_metadata([]))
+        result = _run_check([])
         assert result.passed is True
 
     def test_percentage_in_details(self):
@@ -303,96 +338,81 @@ class TestFontSizePerPage:
                 _make_font(10.0, chars=10, origin_y=400.0),
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert "10.0%" in result.details
 
     def test_global_min_size_in_message(self):
         """Message reports the smallest font size found globally."""
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500),
+                _BODY_500,
                 _make_font(9.5, chars=15, origin_y=400.0),
             ]),
             _make_page(1, [
-                _make_font(12.0, chars=500),
+                _BODY_500,
                 _make_font(10.5, chars=15, origin_y=400.0),
             ]),
         ]
-        result = _check_font_size_per_page(_make_metadata(pages))
+        result = _run_check(pages)
         assert "9.5pt" in result.message
 
     def test_predominant_size_in_details(self):
         pages = [
             _make_page(0, [
-                _make_font(12.0, chars=500),
-                _make_font(10.0, chars=15, origin_y=400.0),
+                _BODY_500,
+                _SMALL_BODY_15,
             ]),
         ]
-        meta = _make_metadata(pages, predominant_font_size=12.0)
-        result = _check_font_size_per_page(meta)
+        result = _run_check(pages, predominant_font_size=12.0)
         assert "Predominant font size: 12.0pt" in result.details
 
-    def test_exactly_threshold_count_is_reject(self):
-        """Exactly FONT_NONCOMPLIANT_THRESHOLD chars → REJECT."""
-        pages = [
-            _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
+    @pytest.mark.parametrize("run_check,expected", [
+        pytest.param(
+            ([_make_page(0, [
+                _BODY_500,
                 _make_font(10.0, chars=FONT_NONCOMPLIANT_THRESHOLD, origin_y=400.0),
-            ]),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages))
-        assert result.severity == Severity.REJECT
-
-    def test_one_below_threshold_is_note(self):
-        """FONT_NONCOMPLIANT_THRESHOLD - 1 chars → NOTE."""
-        pages = [
-            _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
+            ])], 12.0),
+            Severity.REJECT,
+            id="exactly_threshold_count_is_reject",
+        ),
+        pytest.param(
+            ([_make_page(0, [
+                _BODY_500,
                 _make_font(10.0, chars=FONT_NONCOMPLIANT_THRESHOLD - 1, origin_y=400.0),
-            ]),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages))
-        assert result.severity == Severity.NOTE
+            ])], 12.0),
+            Severity.NOTE,
+            id="one_below_threshold_is_note",
+        ),
+    ], indirect=["run_check"])
+    def test_threshold_boundary_severity(self, run_check, expected):
+        """Exactly FONT_NONCOMPLIANT_THRESHOLD chars → REJECT; one fewer → NOTE."""
+        assert run_check.severity == expected
 
 
 # ---------------------------------------------------------------------------
 # _is_all_uppercase tests
 # ---------------------------------------------------------------------------
 
-class TestIsAllUppercase:
+UPPERCASE_CASES = [
+    pytest.param("SMITH", True, id="all_uppercase"),
+    pytest.param("Smith", False, id="mixed_case"),
+    pytest.param("smith", False, id="all_lowercase"),
+    pytest.param("V.", True, id="uppercase_with_period"),
+    pytest.param("SMITH,", True, id="uppercase_with_comma"),
+    pytest.param("IN RE", True, id="uppercase_with_spaces"),
+    # No alpha chars → not small caps
+    pytest.param("123", False, id="digits_only"),
+    pytest.param("", False, id="empty_string"),
+    pytest.param("...", False, id="punctuation_only"),
+    pytest.param("D.", True, id="single_uppercase_letter"),
+    pytest.param("ÉTAT", True, id="unicode_uppercase"),
+]
+
+
+@pytest.mark.parametrize("text,expected", UPPERCASE_CASES)
+def test_is_all_uppercase(text, expected):
     """Unit tests for the small-caps uppercase heuristic helper."""
-
-    def test_all_uppercase(self):
-        assert _is_all_uppercase("SMITH") is True
-
-    def test_mixed_case(self):
-        assert _is_all_uppercase("Smith") is False
-
-    def test_all_lowercase(self):
-        assert _is_all_uppercase("smith") is False
-
-    def test_uppercase_with_punctuation(self):
-        assert _is_all_uppercase("V.") is True
-        assert _is_all_uppercase("SMITH,") is True
-
-    def test_uppercase_with_spaces(self):
-        assert _is_all_uppercase("IN RE") is True
-
-    def test_digits_only(self):
-        # No alpha chars → not small caps
-        assert _is_all_uppercase("123") is False
-
-    def test_empty_string(self):
-        assert _is_all_uppercase("") is False
-
-    def test_punctuation_only(self):
-        assert _is_all_uppercase("...") is False
-
-    def test_single_uppercase_letter(self):
-        assert _is_all_uppercase("D.") is True
-
-    def test_unicode_uppercase(self):
-        assert _is_all_uppercase("ÉTAT") is True
+    assert _is_all_uppercase(text) is expected
 
 
 # ---------------------------------------------------------------------------
@@ -405,77 +425,77 @@ class TestSmallCapsClassification:
     def test_all_uppercase_at_sc_ratio(self):
         """All-uppercase text at 65% of body font → small_caps."""
         # 13pt body font, 8.5pt span → ratio ~0.654
-        font = _make_font(size=8.5, origin_y=400.0, chars=10, text="STATEMENT")
+        font = _font_dict(size=8.5, origin_y=400.0, chars=10, text="STATEMENT")
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "small_caps"
 
     def test_mixed_case_not_small_caps(self):
         """Mixed-case text → body (not small_caps), even at correct ratio."""
-        font = _make_font(size=8.5, origin_y=400.0, chars=10, text="Statement")
+        font = _font_dict(size=8.5, origin_y=400.0, chars=10, text="Statement")
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "body"
 
     def test_ratio_too_low(self):
         """Uppercase text but ratio below 0.55 → body."""
         # 13pt body, 6pt span → ratio ~0.46
-        font = _make_font(size=6.0, origin_y=400.0, chars=10, text="ABC")
+        font = _font_dict(size=6.0, origin_y=400.0, chars=10, text="ABC")
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "body"
 
     def test_ratio_too_high(self):
         """Uppercase text but ratio above 0.85 → body."""
         # 12pt body, 11pt span → ratio ~0.917
-        font = _make_font(size=11.0, origin_y=400.0, chars=10, text="ABC")
+        font = _font_dict(size=11.0, origin_y=400.0, chars=10, text="ABC")
         assert _classify_font_span(font, 792.0, predominant_size=12.0) == "body"
 
     def test_ratio_at_lower_bound(self):
         """Ratio exactly at 0.55 → small_caps."""
         # 20pt body, 11pt span → ratio 0.55
-        font = _make_font(size=11.0, origin_y=400.0, chars=10, text="ABC")
+        font = _font_dict(size=11.0, origin_y=400.0, chars=10, text="ABC")
         assert _classify_font_span(font, 792.0, predominant_size=20.0) == "small_caps"
 
     def test_ratio_at_upper_bound(self):
         """Ratio exactly at 0.85 → small_caps."""
         # 10pt body, 8.5pt span → ratio 0.85
-        font = _make_font(size=8.5, origin_y=400.0, chars=10, text="ABC")
+        font = _font_dict(size=8.5, origin_y=400.0, chars=10, text="ABC")
         assert _classify_font_span(font, 792.0, predominant_size=10.0) == "small_caps"
 
     def test_no_predominant_size_falls_back_to_body(self):
         """Without predominant size, cannot detect small caps → body."""
-        font = _make_font(size=8.5, origin_y=400.0, chars=10, text="STATEMENT")
+        font = _font_dict(size=8.5, origin_y=400.0, chars=10, text="STATEMENT")
         assert _classify_font_span(font, 792.0) == "body"
 
     def test_no_text_falls_back_to_body(self):
         """Without text content, cannot detect small caps → body."""
-        font = _make_font(size=8.5, origin_y=400.0, chars=10)
+        font = _font_dict(size=8.5, origin_y=400.0, chars=10)
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "body"
 
     def test_header_footer_takes_priority_over_small_caps(self):
         """Small caps in footer zone → header_footer (not small_caps)."""
-        font = _make_font(size=8.5, origin_y=750.0, chars=10, text="COURT")
+        font = _font_dict(size=8.5, origin_y=750.0, chars=10, text="COURT")
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "header_footer"
 
     def test_superscript_takes_priority_over_small_caps(self):
         """Small-caps-like text with superscript flag → superscript."""
-        font = _make_font(size=8.0, origin_y=400.0, chars=2, flags=1, text="ST")
+        font = _font_dict(size=8.0, origin_y=400.0, chars=2, flags=1, text="ST")
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "superscript"
 
     def test_short_chars_superscript_over_small_caps(self):
         """<=4 chars at small size → superscript, even if all uppercase."""
-        font = _make_font(size=8.0, origin_y=400.0, chars=2, text="ND")
+        font = _font_dict(size=8.0, origin_y=400.0, chars=2, text="ND")
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "superscript"
 
     def test_case_citation_pattern(self):
         """'V.' at small-caps size → small_caps."""
-        font = _make_font(size=8.5, origin_y=400.0, chars=5, text="V.")
+        font = _font_dict(size=8.5, origin_y=400.0, chars=5, text="V.")
         # chars=5 > 4 so not caught by short-text superscript
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "small_caps"
 
     def test_digits_not_small_caps(self):
         """Pure digit text at SC ratio → body (not small_caps)."""
-        font = _make_font(size=8.5, origin_y=400.0, chars=10, text="2023")
+        font = _font_dict(size=8.5, origin_y=400.0, chars=10, text="2023")
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "body"
 
     def test_typical_cover_court_name(self):
         """Court name like 'SUPREME COURT' at SC ratio → small_caps."""
-        font = _make_font(size=8.5, origin_y=400.0, chars=13, text="SUPREME COURT")
+        font = _font_dict(size=8.5, origin_y=400.0, chars=13, text="SUPREME COURT")
         assert _classify_font_span(font, 792.0, predominant_size=13.0) == "small_caps"
 
 
@@ -483,140 +503,114 @@ class TestSmallCapsClassification:
 # Small-caps integration tests (Layers 2 & 3)
 # ---------------------------------------------------------------------------
 
-class TestSmallCapsIntegration:
+# (pages, predominant, expected_passed, expected_severity, detail_substrings).
+# expected_severity of None leaves severity unchecked; substrings are matched
+# against the lower-cased details.
+SC_SCENARIOS = [
+    # Small caps on cover page (page 0) → PASS with informational note.
+    pytest.param([
+        _make_page(0, [
+            _make_font(13.0, chars=200, origin_y=400.0),
+            _make_font(8.5, chars=30, origin_y=400.0, text="SUPREME COURT"),
+        ]),
+    ], 13.0, True, None, ("small caps",), id="small_caps_only_on_cover_pass"),
+    # Small caps on a page with 'Certificate of Service' → PASS.
+    pytest.param([
+        _make_page(5, [
+            _make_font(13.0, chars=300, origin_y=400.0),
+            _make_font(8.5, chars=20, origin_y=400.0, text="JOHN SMITH"),
+        ], text="Certificate of Service\nI hereby certify..."),
+    ], 13.0, True, None, ("small caps",), id="small_caps_on_certificate_page_pass"),
+    # Small caps on a Table of Authorities page → PASS.
+    pytest.param([
+        _make_page(3, [
+            _BODY_13PT_500,
+            _make_font(8.5, chars=40, origin_y=400.0, text="SMITH V. JONES"),
+        ], text="Table of Authorities\nCases\nSmith v. Jones..."),
+    ], 13.0, True, None, (), id="small_caps_on_toa_page_pass"),
+    # Small caps under the suspicious threshold on a body page → PASS.
+    # 50 small-caps chars out of 5050 total = ~1% → under 15%
+    pytest.param([
+        _make_page(5, [
+            _make_font(13.0, chars=5000, origin_y=400.0),
+            _make_font(8.5, chars=50, origin_y=400.0, text="SMITH V. JONES"),
+        ], text="Argument\nThe defendant argues..."),
+    ], 13.0, True, None, (), id="small_caps_moderate_on_body_page_pass"),
+    # Small caps > 15% of a non-conventional page → reclassified as body.
+    # 200 small-caps chars out of 1000 total = 20% → above 15% threshold;
+    # 200 >= 10 → REJECT
+    pytest.param([
+        _make_page(5, [
+            _make_font(13.0, chars=800, origin_y=400.0),
+            _make_font(8.5, chars=200, origin_y=400.0, text="ENTIRE PARAGRAPH IN SMALL CAPS"),
+        ], text="Argument\nThe defendant argues..."),
+    ], 13.0, False, Severity.REJECT, ("200 body",),
+        id="excessive_small_caps_on_body_page_reclassified"),
+    # Large amount of small caps on cover page → still benign
+    # (cover page is always conventional).
+    pytest.param([
+        _make_page(0, [
+            _make_font(13.0, chars=100, origin_y=400.0),
+            _make_font(8.5, chars=200, origin_y=400.0, text="SUPREME COURT OF NORTH DAKOTA"),
+        ]),
+    ], 13.0, True, None, (),
+        id="excessive_small_caps_on_conventional_page_stays_small_caps"),
+    # Small caps + genuine body violations → FAIL, small caps noted.
+    # 50 body >= 10 → REJECT
+    pytest.param([
+        _make_page(0, [
+            _BODY_13PT_500,
+            _make_font(8.5, chars=20, origin_y=400.0, text="COURT NAME"),  # small caps
+        ]),
+        _make_page(3, [
+            _BODY_13PT_500,
+            _make_font(10.0, chars=50, origin_y=400.0),  # body (no text → body)
+        ]),
+    ], 13.0, False, Severity.REJECT, ("small caps", "50 body"),
+        id="small_caps_mixed_with_body_violations"),
+    # PASS details mention which pages have small caps.
+    pytest.param([
+        _make_page(0, [
+            _make_font(13.0, chars=300, origin_y=400.0),
+            _make_font(8.5, chars=15, origin_y=400.0, text="SUPREME COURT"),
+        ]),
+        _make_page(4, [
+            _BODY_13PT_500,
+            _make_font(8.5, chars=10, origin_y=400.0, text="SMITH V. JONES"),
+        ], text="Table of Authorities\nCases..."),
+    ], 13.0, True, None, ("small caps",), id="small_caps_details_mention_pages"),
+    # Severity is based on nc_body, not nc_total (small caps excluded):
+    # nc_small_caps=50 but nc_body=5 — should be NOTE, not REJECT.
+    pytest.param([
+        _make_page(0, [
+            _make_font(13.0, chars=5000, origin_y=400.0),
+            _make_font(8.5, chars=50, origin_y=400.0, text="COURT NAME HERE"),  # SC
+            _make_font(10.0, chars=5, origin_y=400.0),  # body, < threshold
+        ]),
+    ], 13.0, False, Severity.NOTE, (),
+        id="body_violations_severity_uses_body_count_only"),
+    # Fonts without text/predominant_size work as before (body classification).
+    pytest.param([
+        _make_page(0, [
+            _BODY_500,
+            _SMALL_BODY_15,  # no text → body
+        ]),
+    ], None, False, Severity.REJECT, ("15 body",),
+        id="backward_compat_no_text_no_predominant"),
+]
+
+
+@pytest.mark.parametrize(
+    "pages,predominant,expected_passed,expected_severity,detail_substrings",
+    SC_SCENARIOS,
+)
+def test_small_caps_scenarios(pages, predominant, expected_passed,
+                              expected_severity, detail_substrings):
     """Integration tests for small-caps in the full FMT-006 check."""
-
-    def test_small_caps_only_on_cover_pass(self):
-        """Small caps on cover page (page 0) → PASS with informational note."""
-        pages = [
-            _make_page(0, [
-                _make_font(13.0, chars=200, origin_y=400.0),
-                _make_font(8.5, chars=30, origin_y=400.0, text="SUPREME COURT"),
-            ]),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is True
-        assert "small caps" in result.details.lower()
-
-    def test_small_caps_on_certificate_page_pass(self):
-        """Small caps on a page with 'Certificate of Service' → PASS."""
-        pages = [
-            _make_page(5, [
-                _make_font(13.0, chars=300, origin_y=400.0),
-                _make_font(8.5, chars=20, origin_y=400.0, text="JOHN SMITH"),
-            ], text="Certificate of Service\nI hereby certify..."),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is True
-        assert "small caps" in result.details.lower()
-
-    def test_small_caps_on_toa_page_pass(self):
-        """Small caps on a Table of Authorities page → PASS."""
-        pages = [
-            _make_page(3, [
-                _make_font(13.0, chars=500, origin_y=400.0),
-                _make_font(8.5, chars=40, origin_y=400.0, text="SMITH V. JONES"),
-            ], text="Table of Authorities\nCases\nSmith v. Jones..."),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is True
-
-    def test_small_caps_moderate_on_body_page_pass(self):
-        """Small caps under the suspicious threshold on a body page → PASS."""
-        # 50 small-caps chars out of 5050 total = ~1% → under 15%
-        pages = [
-            _make_page(5, [
-                _make_font(13.0, chars=5000, origin_y=400.0),
-                _make_font(8.5, chars=50, origin_y=400.0, text="SMITH V. JONES"),
-            ], text="Argument\nThe defendant argues..."),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is True
-
-    def test_excessive_small_caps_on_body_page_reclassified(self):
-        """Small caps > 15% of a non-conventional page → reclassified as body."""
-        # 200 small-caps chars out of 1000 total = 20% → above 15% threshold
-        pages = [
-            _make_page(5, [
-                _make_font(13.0, chars=800, origin_y=400.0),
-                _make_font(8.5, chars=200, origin_y=400.0, text="ENTIRE PARAGRAPH IN SMALL CAPS"),
-            ], text="Argument\nThe defendant argues..."),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is False
-        assert result.severity == Severity.REJECT  # 200 >= 10 → REJECT
-        assert "200 body" in result.details
-
-    def test_excessive_small_caps_on_conventional_page_stays_small_caps(self):
-        """Large amount of small caps on cover page → still benign."""
-        # Cover page is always conventional
-        pages = [
-            _make_page(0, [
-                _make_font(13.0, chars=100, origin_y=400.0),
-                _make_font(8.5, chars=200, origin_y=400.0, text="SUPREME COURT OF NORTH DAKOTA"),
-            ]),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is True
-
-    def test_small_caps_mixed_with_body_violations(self):
-        """Small caps + genuine body violations → FAIL, small caps noted."""
-        pages = [
-            _make_page(0, [
-                _make_font(13.0, chars=500, origin_y=400.0),
-                _make_font(8.5, chars=20, origin_y=400.0, text="COURT NAME"),  # small caps
-            ]),
-            _make_page(3, [
-                _make_font(13.0, chars=500, origin_y=400.0),
-                _make_font(10.0, chars=50, origin_y=400.0),  # body (no text → body)
-            ]),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is False
-        assert result.severity == Severity.REJECT  # 50 body >= 10
-        assert "small caps" in result.details.lower()
-        assert "50 body" in result.details
-
-    def test_small_caps_details_mention_pages(self):
-        """PASS details mention which pages have small caps."""
-        pages = [
-            _make_page(0, [
-                _make_font(13.0, chars=300, origin_y=400.0),
-                _make_font(8.5, chars=15, origin_y=400.0, text="SUPREME COURT"),
-            ]),
-            _make_page(4, [
-                _make_font(13.0, chars=500, origin_y=400.0),
-                _make_font(8.5, chars=10, origin_y=400.0, text="SMITH V. JONES"),
-            ], text="Table of Authorities\nCases..."),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is True
-        assert "small caps" in result.details.lower()
-
-    def test_body_violations_severity_uses_body_count_only(self):
-        """Severity is based on nc_body, not nc_total (small caps excluded)."""
-        # nc_small_caps=50 but nc_body=5 — should be NOTE, not REJECT
-        pages = [
-            _make_page(0, [
-                _make_font(13.0, chars=5000, origin_y=400.0),
-                _make_font(8.5, chars=50, origin_y=400.0, text="COURT NAME HERE"),  # SC
-                _make_font(10.0, chars=5, origin_y=400.0),   # body, < threshold
-            ]),
-        ]
-        result = _check_font_size_per_page(_make_metadata(pages, predominant_font_size=13.0))
-        assert result.passed is False
-        assert result.severity == Severity.NOTE  # 5 body < 10 threshold
-
-    def test_backward_compat_no_text_no_predominant(self):
-        """Fonts without text/predominant_size work as before (body classification)."""
-        pages = [
-            _make_page(0, [
-                _make_font(12.0, chars=500, origin_y=400.0),
-                _make_font(10.0, chars=15, origin_y=400.0),  # no text → body
-            ]),
-        ]
-        meta = _make_metadata(pages, predominant_font_size=None)
-        result = _check_font_size_per_page(meta)
-        assert result.passed is False
-        assert result.severity == Severity.REJECT
-        assert "15 body" in result.details
+    result = _run_check(pages, predominant)
+    assert result.passed is expected_passed
+    if expected_severity is not None:
+        assert result.severity is expected_severity
+    details = result.details.lower()
+    for substring in detail_substrings:
+        assert substring in details
@@ -18,24 +18,28 @@ MS Word / Adobe line-spacing reference values (12 pt body text):
 
 from __future__ import annotations
 
-import statistics
-import sys
-import tempfile
-from pathlib import Path
+import functools
+import importlib.util
+import itertools
+import random
 from typing import Optional
 
 import pytest
 
-PROJECT_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_DIR / "skill"))
-
 import fitz  # PyMuPDF
 
+# skill/ is put on sys.path once per session by the root conftest.py.
 from core.constants import MIN_DOUBLE_SPACE_PTS
 from core.checks_mechanical import _check_double_spacing
 from core.models import BriefMetadata, PageInfo, Severity
 from core.pdf_extract import _estimate_line_spacing
 
+# Force MuPDF's one-time context setup at import so it is not charged to
+# whichever test happens to open the first document.
+fitz.TOOLS.mupdf_warnings()
+
+_TEXT_FLAG = fitz.TEXT_PRESERVE_WHITESPACE
+
 
 # ---------------------------------------------------------------------------
 # MS Word / Adobe standard spacing values (pts) for 12 pt text
@@ -67,42 +71,32 @@ ADOBE_AUTO_10PT = 12.0
 # Helpers – synthetic MuPDF block dicts
 # ---------------------------------------------------------------------------
 
+# ``_estimate_line_spacing`` reads only block "type"/"lines", line "spans" and
+# span "text"/"origin", so the synthetic dicts carry just those (plus size).
+
 def _make_span(text: str, origin_y: float, font_size: float = 12.0) -> dict:
     """Build a minimal MuPDF span dict."""
-    return {
-        "text": text,
-        "origin": (108.0, origin_y),
-        "font": "Helvetica",
-        "size": font_size,
-        "flags": 0,
-        "color": 0,
-        "bbox": (108.0, origin_y - font_size, 400.0, origin_y),
-    }
+    return {"text": text, "origin": (108.0, origin_y), "size": font_size}
 
 
 def _make_line(origin_y: float, text: str = "Sample text", font_size: float = 12.0) -> dict:
     """Build a minimal MuPDF line dict."""
-    span = _make_span(text, origin_y, font_size)
-    return {
-        "spans": [span],
-        "bbox": span["bbox"],
-        "wmode": 0,
-        "dir": (1.0, 0.0),
-    }
+    return {"spans": [_make_span(text, origin_y, font_size)]}
 
 
 def _make_block(origin_ys: list[float], font_size: float = 12.0) -> dict:
     """Build a text block with lines at the given baseline y-positions."""
-    lines = [_make_line(y, f"Line at y={y}", font_size) for y in origin_ys]
-    top = min(y - font_size for y in origin_ys)
-    bottom = max(origin_ys)
     return {
         "type": 0,
-        "bbox": (108.0, top, 400.0, bottom),
-        "lines": lines,
+        "lines": [_make_line(y, f"Line at y={y}", font_size) for y in origin_ys],
     }
 
 
+def _linspace_ys(base: float, step: float, n: int) -> list[float]:
+    """*n* evenly spaced baselines starting at *base*."""
+    return [base + i * step for i in range(n)]
+
+
 def _make_image_block() -> dict:
     """Build an image block (type 1) — should be skipped."""
     return {"type": 1, "bbox": (0, 0, 100, 100)}
@@ -136,6 +130,10 @@ def _make_metadata(page_spacings: list[Optional[float]]) -> BriefMetadata:
 # Helpers – PDF generation
 # ---------------------------------------------------------------------------
 
+_LINE_PREFIX = "This is line "
+_LINE_SUFFIX = " of the test document with controlled spacing."
+
+
 def _build_pdf_bytes(leading: float, font_size: float = 12.0,
                      num_lines: int = 20) -> bytes:
     """Build a minimal single-page PDF with explicit text leading (TL).
@@ -144,220 +142,229 @@ def _build_pdf_bytes(leading: float, font_size: float = 12.0,
     distance is exactly *leading* points, matching how MS Word and Adobe
     encode line spacing in the ``TL`` / ``Td`` operators.
     """
-    lines_ops = []
-    for i in range(num_lines):
-        text = f"This is line {i + 1} of the test document with controlled spacing."
-        text = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
-        lines_ops.append(f"({text}) Tj T*")
-
-    stream = (
-        f"BT\n"
-        f"/F1 {font_size} Tf\n"
-        f"{leading} TL\n"
-        f"108 708 Td\n"
-        + "\n".join(lines_ops)
-        + "\nET"
+    return _build_pdf_bytes_multipage([(leading, font_size)], num_lines)
+
+
+def _content_stream(leading: float, font_size: float, num_lines: int) -> bytes:
+    # The text around the line number has no backslashes or parentheses, so
+    # it needs no PDF string escaping.
+    lines_ops = [
+        f"({_LINE_PREFIX}{i + 1}{_LINE_SUFFIX}) Tj T*\n".encode("latin-1")
+        for i in range(num_lines)
+    ]
+    return (
+        f"BT\n/F1 {font_size} Tf\n{leading} TL\n108 708 Td\n".encode("latin-1")
+        + b"".join(lines_ops)
+        + b"ET"
     )
-    stream_bytes = stream.encode("latin-1")
 
+
+def _build_pdf_bytes_multipage(combos: list[tuple[float, float]],
+                               num_lines: int = 20) -> bytes:
+    """Build a PDF with one page per ``(leading, font_size)`` in *combos*.
+
+    Objects 1-3 are the catalog, page tree and shared font; each page then
+    takes a page object and its content stream.
+    """
+    page_refs = " ".join(f"{4 + 2 * k} 0 R" for k in range(len(combos)))
     objs = [
         b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj",
-        b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj",
-        (b"3 0 obj\n<< /Type /Page /Parent 2 0 R "
-         b"/MediaBox [0 0 612 792] /Contents 4 0 R "
-         b"/Resources << /Font << /F1 5 0 R >> >> >>\nendobj"),
-        (f"4 0 obj\n<< /Length {len(stream_bytes)} >>\nstream\n".encode("latin-1")
-         + stream_bytes + b"\nendstream\nendobj"),
-        b"5 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj",
+        (f"2 0 obj\n<< /Type /Pages /Kids [{page_refs}] "
+         f"/Count {len(combos)} >>\nendobj").encode("latin-1"),
+        b"3 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj",
     ]
-
-    pdf = bytearray(b"%PDF-1.4\n")
-    offsets = []
+    for k, (leading, font_size) in enumerate(combos):
+        page_no, content_no = 4 + 2 * k, 5 + 2 * k
+        stream_bytes = _content_stream(leading, font_size, num_lines)
+        objs.append(
+            f"{page_no} 0 obj\n<< /Type /Page /Parent 2 0 R "
+            f"/MediaBox [0 0 612 792] /Contents {content_no} 0 R "
+            f"/Resources << /Font << /F1 3 0 R >> >> >>\nendobj".encode("latin-1")
+        )
+        objs.append(
+            f"{content_no} 0 obj\n<< /Length {len(stream_bytes)} >>\nstream\n".encode("latin-1")
+            + stream_bytes + b"\nendstream\nendobj"
+        )
+
+    header = b"%PDF-1.4\n"
+    # Each object is followed by one newline, so offsets are a running sum
+    # and the xref position is known before anything is copied.
+    offsets = list(itertools.accumulate([len(header)] + [len(o) + 1 for o in objs]))
+    xref_off = offsets.pop()
+
+    parts = [header]
     for obj in objs:
-        offsets.append(len(pdf))
-        pdf.extend(obj + b"\n")
-
-    xref_off = len(pdf)
-    pdf.extend(f"xref\n0 {len(objs) + 1}\n".encode())
-    pdf.extend(b"0000000000 65535 f \n")
-    for off in offsets:
-        pdf.extend(f"{off:010d} 00000 n \n".encode())
-    pdf.extend(f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\n".encode())
-    pdf.extend(f"startxref\n{xref_off}\n%%EOF\n".encode())
-    return bytes(pdf)
-
-
-def _pdf_blocks(leading: float, font_size: float = 12.0,
-                num_lines: int = 20) -> list[dict]:
-    """Generate a PDF and return its MuPDF text blocks."""
-    pdf_bytes = _build_pdf_bytes(leading, font_size, num_lines)
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-        f.write(pdf_bytes)
-        tmp_path = f.name
-    try:
-        doc = fitz.open(tmp_path)
-        blocks = doc[0].get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
-        doc.close()
-        return blocks
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
-
-
-def _pdf_origin_spacings(leading: float, font_size: float = 12.0,
-                         num_lines: int = 20) -> list[float]:
-    """Return the list of actual baseline-to-baseline spacings in a generated PDF."""
-    blocks = _pdf_blocks(leading, font_size, num_lines)
-    origins: list[float] = []
-    for b in blocks:
-        if b["type"] != 0:
-            continue
-        for line in b.get("lines", []):
-            for span in line.get("spans", []):
-                if span["text"].strip():
-                    origins.append(span["origin"][1])
-                    break
-    return [origins[i + 1] - origins[i] for i in range(len(origins) - 1)]
+        parts += (obj, b"\n")
+    parts.append(f"xref\n0 {len(objs) + 1}\n".encode())
+    parts.append(b"0000000000 65535 f \n")
+    parts.extend(f"{off:010d} 00000 n \n".encode() for off in offsets)
+    parts.append(f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\n".encode())
+    parts.append(f"startxref\n{xref_off}\n%%EOF\n".encode())
+    # bytes.join sizes the result from all parts first, so the file is
+    # written into one exactly-sized buffer with no regrowth.
+    return b"".join(parts)
+
+
+# Every (leading, font_size) the generated-PDF tests read, one page each.
+_PDF_COMBOS = list(dict.fromkeys([
+    (MS_WORD_SINGLE_12PT, FONT_SIZE_12),
+    (MS_WORD_115_12PT, FONT_SIZE_12),
+    (ADOBE_AUTO_12PT, FONT_SIZE_12),
+    (MS_WORD_150_12PT, FONT_SIZE_12),
+    (ADOBE_DOUBLE_12PT, FONT_SIZE_12),
+    (MS_WORD_DOUBLE_12PT, FONT_SIZE_12),
+    (MS_WORD_SINGLE_10PT, FONT_SIZE_10),
+]))
+
+
+@pytest.fixture(scope="session")
+def pdf_blocks():
+    """Text of one combined generated PDF, opened once per session.
+
+    Returns ``blocks(leading, font_size=12.0, mode="dict")``.
+    ``mode="dict"`` gives the nested block dicts ``_estimate_line_spacing``
+    consumes; ``mode="words"`` gives PyMuPDF's flat word tuples, which are
+    far cheaper to build when only line positions are needed.  Results are
+    memoized; the estimator never mutates blocks.
+    """
+    doc = fitz.open(stream=_build_pdf_bytes_multipage(_PDF_COMBOS), filetype="pdf")
+    page_index = {combo: i for i, combo in enumerate(_PDF_COMBOS)}
+    cache: dict[tuple, list] = {}
+
+    def blocks(leading: float, font_size: float = FONT_SIZE_12,
+               mode: str = "dict") -> list:
+        key = (leading, font_size, mode)
+        if key not in cache:
+            page = doc[page_index[(leading, font_size)]]
+            if mode == "words":
+                cache[key] = page.get_text("words")
+            else:
+                cache[key] = page.get_text("dict", flags=_TEXT_FLAG)["blocks"]
+        return cache[key]
+
+    yield blocks
+    doc.close()
+
+
+def _word_line_gaps(words: list[tuple]) -> list[float]:
+    """Return line-to-line distances from PyMuPDF word tuples.
+
+    Each tuple is ``(x0, y0, x1, y1, word, block_no, line_no, word_no)``; the
+    first word of each line stands for the line.  Every line uses the same
+    font, so bottom-to-bottom distance equals baseline-to-baseline distance.
+    """
+    bottoms: dict[tuple[int, int], float] = {}
+    for w in words:
+        bottoms.setdefault((w[5], w[6]), w[3])
+    ys = list(bottoms.values())
+    return [b - a for a, b in zip(ys, ys[1:])]
 
 
 # ===================================================================
 # Unit tests: _estimate_line_spacing with synthetic block dicts
 # ===================================================================
 
-class TestEstimateLineSpacingSynthetic:
-    """Test the spacing-estimation algorithm using hand-crafted block dicts."""
-
-    # -- MS Word standards, 12 pt ----------------------------------------
-
-    def test_ms_word_single_12pt(self):
-        """MS Word single spacing (14.4 pt) for 12 pt text."""
-        ys = [100 + i * MS_WORD_SINGLE_12PT for i in range(15)]
-        blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
-        assert result == pytest.approx(MS_WORD_SINGLE_12PT, abs=0.5)
-
-    def test_ms_word_115_default_12pt(self):
-        """MS Word 1.15 default spacing (≈16.6 pt) for 12 pt text."""
-        ys = [100 + i * MS_WORD_115_12PT for i in range(15)]
-        blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
-        assert result == pytest.approx(MS_WORD_115_12PT, abs=0.5)
-
-    def test_ms_word_150_12pt(self):
-        """MS Word 1.5-line spacing (≈21.6 pt) for 12 pt text."""
-        ys = [100 + i * MS_WORD_150_12PT for i in range(15)]
-        blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
-        assert result == pytest.approx(MS_WORD_150_12PT, abs=0.5)
-
-    def test_ms_word_double_12pt(self):
-        """MS Word double spacing (28.8 pt) for 12 pt text."""
-        ys = [100 + i * MS_WORD_DOUBLE_12PT for i in range(15)]
-        blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
-        assert result == pytest.approx(MS_WORD_DOUBLE_12PT, abs=0.5)
-
-    # -- Adobe standards, 12 pt ------------------------------------------
-
-    def test_adobe_auto_leading_12pt(self):
-        """Adobe InDesign auto leading (14.4 pt = 120%) for 12 pt text."""
-        ys = [100 + i * ADOBE_AUTO_12PT for i in range(15)]
-        blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
-        assert result == pytest.approx(ADOBE_AUTO_12PT, abs=0.5)
-
-    def test_adobe_double_12pt(self):
-        """Adobe 'Exactly 24 pt' double spacing for 12 pt text."""
-        ys = [100 + i * ADOBE_DOUBLE_12PT for i in range(15)]
-        blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
-        assert result == pytest.approx(ADOBE_DOUBLE_12PT, abs=0.5)
+@pytest.fixture(params=[
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(
+        importlib.util.find_spec("numpy") is None, reason="numpy not installed")),
+], ids=["stdlib", "numpy"])
+def estimate(request):
+    """``_estimate_line_spacing`` on both median backends."""
+    return functools.partial(_estimate_line_spacing, use_numpy=request.param)
 
-    # -- 10 pt text -------------------------------------------------------
 
-    def test_ms_word_single_10pt(self):
-        """MS Word single spacing (12.0 pt) for 10 pt text."""
-        ys = [100 + i * MS_WORD_SINGLE_10PT for i in range(15)]
-        blocks = [_make_block(ys, font_size=FONT_SIZE_10)]
-        result = _estimate_line_spacing(blocks)
-        assert result == pytest.approx(MS_WORD_SINGLE_10PT, abs=0.5)
+class TestEstimateLineSpacingSynthetic:
+    """Test the spacing-estimation algorithm using hand-crafted block dicts."""
 
-    def test_ms_word_double_10pt(self):
-        """MS Word double spacing (24.0 pt) for 10 pt text."""
-        ys = [100 + i * MS_WORD_DOUBLE_10PT for i in range(15)]
-        blocks = [_make_block(ys, font_size=FONT_SIZE_10)]
-        result = _estimate_line_spacing(blocks)
-        assert result == pytest.approx(MS_WORD_DOUBLE_10PT, abs=0.5)
+    # -- MS Word / Adobe standards at 12 pt and 10 pt ---------------------
+
+    @pytest.mark.parametrize("leading,font_size", [
+        pytest.param(MS_WORD_SINGLE_12PT, FONT_SIZE_12, id="ms_word_single_12pt"),
+        pytest.param(MS_WORD_115_12PT, FONT_SIZE_12, id="ms_word_115_default_12pt"),
+        pytest.param(MS_WORD_150_12PT, FONT_SIZE_12, id="ms_word_150_12pt"),
+        pytest.param(MS_WORD_DOUBLE_12PT, FONT_SIZE_12, id="ms_word_double_12pt"),
+        pytest.param(ADOBE_AUTO_12PT, FONT_SIZE_12, id="adobe_auto_leading_12pt"),
+        pytest.param(ADOBE_DOUBLE_12PT, FONT_SIZE_12, id="adobe_double_12pt"),
+        pytest.param(MS_WORD_SINGLE_10PT, FONT_SIZE_10, id="ms_word_single_10pt"),
+        pytest.param(MS_WORD_DOUBLE_10PT, FONT_SIZE_10, id="ms_word_double_10pt"),
+    ])
+    def test_ms_word_spacing_detected(self, estimate, leading, font_size):
+        """Standard MS Word / Adobe leadings are measured to within 0.5 pt."""
+        ys = _linspace_ys(100, leading, 15)
+        result = estimate([_make_block(ys, font_size=font_size)])
+        assert result == pytest.approx(leading, abs=0.5)
 
     # -- Boundary / threshold tests --------------------------------------
 
-    def test_exactly_at_double_threshold(self):
+    def test_exactly_at_double_threshold(self, estimate):
         """Spacing exactly at MIN_DOUBLE_SPACE_PTS (20.0) is accepted."""
-        ys = [100 + i * MIN_DOUBLE_SPACE_PTS for i in range(10)]
+        ys = _linspace_ys(100, MIN_DOUBLE_SPACE_PTS, 10)
         blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
+        result = estimate(blocks)
         assert result == pytest.approx(MIN_DOUBLE_SPACE_PTS, abs=0.5)
 
-    def test_just_below_double_threshold(self):
+    def test_just_below_double_threshold(self, estimate):
         """Spacing just below MIN_DOUBLE_SPACE_PTS should be measurable."""
         spacing = MIN_DOUBLE_SPACE_PTS - 1.0  # 19.0 pt
-        ys = [100 + i * spacing for i in range(10)]
+        ys = _linspace_ys(100, spacing, 10)
         blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
+        result = estimate(blocks)
         assert result == pytest.approx(spacing, abs=0.5)
 
     # -- Edge cases -------------------------------------------------------
 
-    def test_empty_blocks_returns_none(self):
+    def test_empty_blocks_returns_none(self, estimate):
         """No blocks → None."""
-        assert _estimate_line_spacing([]) is None
+        assert estimate([]) is None
 
-    def test_image_blocks_only_returns_none(self):
+    def test_image_blocks_only_returns_none(self, estimate):
         """Only image blocks (type 1) → None."""
-        assert _estimate_line_spacing([_make_image_block()]) is None
+        assert estimate([_make_image_block()]) is None
 
-    def test_single_line_block_returns_none(self):
+    def test_single_line_block_returns_none(self, estimate):
         """A block with only one line cannot produce a spacing measurement."""
         blocks = [_make_block([200.0])]
-        assert _estimate_line_spacing(blocks) is None
+        assert estimate(blocks) is None
 
-    def test_filters_out_tiny_spacings(self):
+    def test_filters_out_tiny_spacings(self, estimate):
         """Spacings ≤ 8 pt are filtered as outliers."""
         # Two lines only 5 pt apart (sub-script overlap, etc.)
         blocks = [_make_block([100.0, 105.0])]
-        assert _estimate_line_spacing(blocks) is None
+        assert estimate(blocks) is None
 
-    def test_filters_out_huge_spacings(self):
+    def test_filters_out_huge_spacings(self, estimate):
         """Spacings ≥ 60 pt are filtered as outliers (page break / section gap)."""
         blocks = [_make_block([100.0, 165.0])]
-        assert _estimate_line_spacing(blocks) is None
+        assert estimate(blocks) is None
 
-    def test_median_used_not_mean(self):
+    def test_median_used_not_mean(self, estimate):
         """Verify median (not mean) is returned when outliers are present."""
         # 9 lines at 24 pt spacing + 1 outlier gap at 50 pt
-        ys = [100 + i * 24.0 for i in range(9)]
+        ys = _linspace_ys(100, 24.0, 9)
         ys.append(ys[-1] + 50.0)  # 50 pt gap — within filter range but large
         blocks = [_make_block(ys)]
-        result = _estimate_line_spacing(blocks)
+        result = estimate(blocks)
         # Median of eight 24.0 values plus one 50.0 value = 24.0
         assert result == pytest.approx(24.0, abs=0.5)
 
-    def test_multiple_blocks(self):
+    def test_multiple_blocks(self, estimate):
         """Spacings are collected across multiple blocks."""
         block_a = _make_block([100, 124, 148])        # 24 pt spacing
         block_b = _make_block([300, 324, 348, 372])   # 24 pt spacing
-        result = _estimate_line_spacing([block_a, block_b])
+        result = estimate([block_a, block_b])
         assert result == pytest.approx(24.0, abs=0.5)
 
-    def test_mixed_spacing_blocks_uses_median(self):
+    def test_mixed_spacing_blocks_uses_median(self, estimate):
         """When blocks have different spacings, median wins."""
         # 3 gaps at 14 pt (single) + 5 gaps at 24 pt (double)
-        single_block = _make_block([100 + i * 14.0 for i in range(4)])   # 3 gaps
-        double_block = _make_block([300 + i * 24.0 for i in range(6)])   # 5 gaps
-        result = _estimate_line_spacing([single_block, double_block])
+        single_block = _make_block(_linspace_ys(100, 14.0, 4))   # 3 gaps
+        double_block = _make_block(_linspace_ys(300, 24.0, 6))   # 5 gaps
+        result = estimate([single_block, double_block])
         # Median of [14, 14, 14, 24, 24, 24, 24, 24] = 24
         assert result == pytest.approx(24.0, abs=0.5)
 
-    def test_whitespace_only_spans_excluded(self):
+    def test_whitespace_only_spans_excluded(self, estimate):
         """Spans containing only whitespace should not contribute origins."""
         block = {
             "type": 0,
@@ -369,14 +376,30 @@ class TestEstimateLineSpacingSynthetic:
                  "bbox": (108, 112, 400, 124), "wmode": 0, "dir": (1, 0)},
             ],
         }
-        result = _estimate_line_spacing([block])
+        result = estimate([block])
         assert result == pytest.approx(24.0, abs=0.5)
 
+    @pytest.mark.skipif(importlib.util.find_spec("numpy") is None,
+                        reason="numpy not installed")
+    def test_branchless_filter_matches_reference(self):
+        """The numpy mask/median agrees with the stdlib filter on 10k gaps."""
+        rng = random.Random(0)
+        # Mostly plausible spacings with tiny and huge outliers mixed in.
+        gaps = [rng.uniform(0.0, 80.0) for _ in range(10_000)]
+        ys = list(itertools.accumulate(gaps, initial=100.0))
+        blocks = [_make_block(ys)]
+        reference = _estimate_line_spacing(blocks, use_numpy=False)
+        assert reference is not None
+        assert _estimate_line_spacing(blocks, use_numpy=True) == pytest.approx(reference)
+
 
 # ===================================================================
 # Integration tests: generated PDFs with known TL (text leading)
 # ===================================================================
 
+# Under ``pytest -n auto --dist=loadgroup`` the whole class lands on one
+# worker, so the combined PDF behind ``pdf_blocks`` is opened only once.
+@pytest.mark.xdist_group("line_spacing_pdf")
 class TestEstimateLineSpacingPDF:
     """Verify that PDFs with exact TL values produce correct origin spacings.
 
@@ -395,9 +418,9 @@ class TestEstimateLineSpacingPDF:
         (MS_WORD_115_12PT,    "MS Word 1.15 default 12pt"),
         (ADOBE_AUTO_12PT,     "Adobe auto 12pt"),
     ])
-    def test_pdf_origins_single_range(self, leading, label):
+    def test_pdf_origins_single_range(self, pdf_blocks, leading, label):
         """Generated PDF baselines match the intended leading (single range)."""
-        diffs = _pdf_origin_spacings(leading)
+        diffs = _word_line_gaps(pdf_blocks(leading, mode="words"))
         assert len(diffs) > 0, f"{label}: no line spacings extracted"
         for d in diffs:
             assert d == pytest.approx(leading, abs=0.2), (
@@ -409,9 +432,9 @@ class TestEstimateLineSpacingPDF:
         (ADOBE_DOUBLE_12PT,   "Adobe double 12pt"),
         (MS_WORD_DOUBLE_12PT, "MS Word double 12pt"),
     ])
-    def test_pdf_origins_double_range(self, leading, label):
+    def test_pdf_origins_double_range(self, pdf_blocks, leading, label):
         """Generated PDF baselines match the intended leading (double range)."""
-        diffs = _pdf_origin_spacings(leading)
+        diffs = _word_line_gaps(pdf_blocks(leading, mode="words"))
         assert len(diffs) > 0, f"{label}: no line spacings extracted"
         for d in diffs:
             assert d == pytest.approx(leading, abs=0.2), (
@@ -420,21 +443,21 @@ class TestEstimateLineSpacingPDF:
 
     # -- _estimate_line_spacing on generated PDFs ------------------------
 
-    def test_detects_single_spacing_from_pdf(self):
+    def test_detects_single_spacing_from_pdf(self, pdf_blocks):
         """Single-spaced PDF (14.4 pt): lines grouped in one block → detected."""
-        blocks = _pdf_blocks(MS_WORD_SINGLE_12PT)
+        blocks = pdf_blocks(MS_WORD_SINGLE_12PT)
         result = _estimate_line_spacing(blocks)
         assert result is not None
         assert result == pytest.approx(MS_WORD_SINGLE_12PT, abs=0.5)
 
-    def test_detects_word_default_115_from_pdf(self):
+    def test_detects_word_default_115_from_pdf(self, pdf_blocks):
         """MS Word 1.15 default (16.6 pt): detected when lines are grouped."""
-        blocks = _pdf_blocks(MS_WORD_115_12PT)
+        blocks = pdf_blocks(MS_WORD_115_12PT)
         result = _estimate_line_spacing(blocks)
         assert result is not None
         assert result == pytest.approx(MS_WORD_115_12PT, abs=0.5)
 
-    def test_double_spacing_blocks_split(self):
+    def test_double_spacing_blocks_split(self, pdf_blocks):
         """Double-spaced PDF: MuPDF splits lines into separate blocks.
 
         This is expected behavior — MuPDF's block detection uses spatial
@@ -442,7 +465,7 @@ class TestEstimateLineSpacingPDF:
         ``_estimate_line_spacing`` returns None because no block has
         multiple lines.
         """
-        blocks = _pdf_blocks(MS_WORD_DOUBLE_12PT)
+        blocks = pdf_blocks(MS_WORD_DOUBLE_12PT)
         text_blocks = [b for b in blocks if b["type"] == 0]
         # Each line in its own block
         for b in text_blocks:
@@ -450,14 +473,14 @@ class TestEstimateLineSpacingPDF:
         # Therefore no intra-block spacing can be measured
         assert _estimate_line_spacing(blocks) is None
 
-    def test_adobe_double_blocks_split(self):
+    def test_adobe_double_blocks_split(self, pdf_blocks):
         """Adobe 24 pt double spacing: also splits into separate blocks."""
-        blocks = _pdf_blocks(ADOBE_DOUBLE_12PT)
+        blocks = pdf_blocks(ADOBE_DOUBLE_12PT)
         assert _estimate_line_spacing(blocks) is None
 
-    def test_10pt_single_from_pdf(self):
+    def test_10pt_single_from_pdf(self, pdf_blocks):
         """10 pt single spacing (12.0 pt leading) detected from PDF."""
-        blocks = _pdf_blocks(MS_WORD_SINGLE_10PT, font_size=FONT_SIZE_10)
+        blocks = pdf_blocks(MS_WORD_SINGLE_10PT, font_size=FONT_SIZE_10)
         result = _estimate_line_spacing(blocks)
         assert result is not None
         assert result == pytest.approx(MS_WORD_SINGLE_10PT, abs=0.5)
@@ -467,29 +490,36 @@ class TestEstimateLineSpacingPDF:
 # Full-pipeline test: extract_brief on generated PDF
 # ===================================================================
 
+@pytest.fixture(scope="class")
+def single_spaced_pdf_path(tmp_path_factory) -> str:
+    path = tmp_path_factory.mktemp("line_spacing") / "single.pdf"
+    path.write_bytes(_build_pdf_bytes(MS_WORD_SINGLE_12PT))
+    return str(path)
+
+
+@pytest.fixture(scope="class")
+def double_spaced_pdf_path(tmp_path_factory) -> str:
+    path = tmp_path_factory.mktemp("line_spacing") / "double.pdf"
+    path.write_bytes(_build_pdf_bytes(MS_WORD_DOUBLE_12PT))
+    return str(path)
+
+
 class TestExtractBriefLineSpacing:
     """Test ``extract_brief`` end-to-end on generated PDFs."""
 
-    def test_extract_brief_single_spaced(self):
+    def test_extract_brief_single_spaced(self, single_spaced_pdf_path):
         """extract_brief reports single spacing for a 14.4 pt PDF."""
         from core.pdf_extract import extract_brief
 
-        pdf_bytes = _build_pdf_bytes(MS_WORD_SINGLE_12PT)
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(pdf_bytes)
-            tmp = f.name
-        try:
-            meta = extract_brief(tmp)
-            assert meta.pages[0].line_spacing is not None
-            assert meta.pages[0].line_spacing == pytest.approx(
-                MS_WORD_SINGLE_12PT, abs=0.5
-            )
-            # 14.4 pt < 20.0 pt → NOT double-spaced
-            assert meta.has_double_spacing is False
-        finally:
-            Path(tmp).unlink(missing_ok=True)
+        meta = extract_brief(single_spaced_pdf_path)
+        assert meta.pages[0].line_spacing is not None
+        assert meta.pages[0].line_spacing == pytest.approx(
+            MS_WORD_SINGLE_12PT, abs=0.5
+        )
+        # 14.4 pt < 20.0 pt → NOT double-spaced
+        assert meta.has_double_spacing is False
 
-    def test_extract_brief_double_spaced_returns_none(self):
+    def test_extract_brief_double_spaced_returns_none(self, double_spaced_pdf_path):
         """extract_brief gets None spacing for double-spaced PDF (block split).
 
         When no page reports a line_spacing value, has_double_spacing
@@ -497,17 +527,10 @@ class TestExtractBriefLineSpacing:
         """
         from core.pdf_extract import extract_brief
 
-        pdf_bytes = _build_pdf_bytes(MS_WORD_DOUBLE_12PT)
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(pdf_bytes)
-            tmp = f.name
-        try:
-            meta = extract_brief(tmp)
-            assert meta.pages[0].line_spacing is None
-            # No measurable spacing → default True
-            assert meta.has_double_spacing is True
-        finally:
-            Path(tmp).unlink(missing_ok=True)
+        meta = extract_brief(double_spaced_pdf_path)
+        assert meta.pages[0].line_spacing is None
+        # No measurable spacing → default True
+        assert meta.has_double_spacing is True
 
 
 # ===================================================================
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import shutil
 import tempfile
 from datetime import date, timedelta
@@ -38,6 +39,7 @@ from core.version_check import (
     check_remote_version,
     check_rule_hashes,
     check_rule_staleness,
+    clear_version_cache,
     compute_all_rule_hashes,
     compute_rule_hash,
     fetch_remote_version,
@@ -91,6 +93,36 @@ class TestLoadLocalVersion:
         result = load_local_version()
         assert result == {}
 
+    def test_reloads_when_file_changes(self, tmp_path, monkeypatch):
+        vf = tmp_path / "version.json"
+        vf.write_text(json.dumps({"version": "1.0.0"}), encoding="utf-8")
+        monkeypatch.setattr("core.version_check.VERSION_FILE", vf)
+        assert load_local_version()["version"] == "1.0.0"
+        vf.write_text(json.dumps({"version": "1.0.10"}), encoding="utf-8")
+        assert load_local_version()["version"] == "1.0.10"
+
+    def test_cache_clear_forces_reload(self, tmp_path, monkeypatch):
+        vf = tmp_path / "version.json"
+        vf.write_text(json.dumps({"version": "1.0.0"}), encoding="utf-8")
+        monkeypatch.setattr("core.version_check.VERSION_FILE", vf)
+        assert load_local_version()["version"] == "1.0.0"
+        # Same size and mtime: the stat key cannot see the edit.
+        st = vf.stat()
+        vf.write_text(json.dumps({"version": "1.0.1"}), encoding="utf-8")
+        os.utime(vf, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert load_local_version()["version"] == "1.0.0"
+        clear_version_cache()
+        assert load_local_version()["version"] == "1.0.1"
+
+    def test_returned_dict_is_a_copy(self, tmp_path, monkeypatch):
+        vf = tmp_path / "version.json"
+        vf.write_text(json.dumps({"version": "1.0.0", "rule_hashes": {}}), encoding="utf-8")
+        monkeypatch.setattr("core.version_check.VERSION_FILE", vf)
+        local = load_local_version()
+        local["version"] = "9.9.9"
+        local["rule_hashes"]["rule-14.md"] = "blake2b:00"
+        assert load_local_version() == {"version": "1.0.0", "rule_hashes": {}}
+
 
 # ---------------------------------------------------------------------------
 # 2. Rule hash computation
@@ -99,8 +131,8 @@ class TestLoadLocalVersion:
 class TestRuleHashes:
     def test_compute_single_hash(self, tmp_rule_file):
         h = compute_rule_hash(tmp_rule_file)
-        assert h.startswith("sha256:")
-        assert len(h) == 7 + 64  # "sha256:" + 64 hex chars
+        assert h.startswith("blake2b:")
+        assert len(h) == 8 + 64  # "blake2b:" + 64 hex chars
 
     def test_hash_is_deterministic(self, tmp_rule_file):
         h1 = compute_rule_hash(tmp_rule_file)
@@ -120,7 +152,7 @@ class TestRuleHashes:
                           "rule-32.md", "rule-34.md", "rule-3.4.md"}
         assert expected_files.issubset(set(hashes.keys()))
         for h in hashes.values():
-            assert h.startswith("sha256:")
+            assert h.startswith("blake2b:")
 
     def test_computed_hashes_match_version_json(self, local_version):
         """The on-disk rule files should match the hashes stored in version.json."""
@@ -143,6 +175,21 @@ class TestCheckRuleHashes:
         warnings = check_rule_hashes(local_version)
         assert warnings == []
 
+    def test_clean_result_skips_rehash(self, local_version):
+        assert check_rule_hashes(local_version) == []
+        with patch("core.version_check.compute_all_rule_hashes") as mock_hashes:
+            assert check_rule_hashes(local_version) == []
+            mock_hashes.assert_not_called()
+
+    def test_accepts_legacy_sha256_digests(self, local_version):
+        """A version.json with sha256 digests of unmodified files verifies clean."""
+        legacy = dict(local_version)
+        legacy["rule_hashes"] = {
+            name: "sha256:" + hashlib.sha256((RULES_DIR / name).read_bytes()).hexdigest()
+            for name in local_version["rule_hashes"]
+        }
+        assert check_rule_hashes(legacy) == []
+
     def test_warns_on_hash_mismatch(self, local_version):
         tampered = dict(local_version)
         tampered["rule_hashes"] = dict(tampered["rule_hashes"])
@@ -203,6 +250,20 @@ class TestCheckRuleStaleness:
         result = check_rule_staleness({})
         assert result == [cached_warning]
 
+    def test_fresh_cache_is_read_once_per_day(self, tmp_path, monkeypatch):
+        """An unchanged fresh cache is not re-read on later calls the same day."""
+        cache_file = tmp_path / "staleness.json"
+        cache_file.write_text(json.dumps({
+            "last_checked": date.today().isoformat(),
+            "warnings": ["cached"],
+        }), encoding="utf-8")
+        monkeypatch.setattr("core.version_check.STALENESS_CACHE", cache_file)
+
+        assert check_rule_staleness({}) == ["cached"]
+        with patch("core.version_check._load_staleness_cache") as mock_load:
+            assert check_rule_staleness({}) == ["cached"]
+            mock_load.assert_not_called()
+
     def test_checks_live_when_cache_expired(self, tmp_path, monkeypatch):
         """When the cache is older than STALENESS_MAX_AGE_DAYS, fetch live."""
         cache_file = tmp_path / "staleness.json"
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import shutil
+import threading
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from flask import (
     Blueprint,
     current_app,
     flash,
-    jsonify,
     redirect,
     render_template,
     request,
@@ -18,18 +22,68 @@ from flask import (
 )
 from werkzeug.utils import secure_filename
 
+from core import json_compat
 from core.brief_classifier import classify_brief
-from core.checks_mechanical import run_mechanical_checks
-from core.checks_semantic import run_semantic_checks
+from core.checks import run_all_checks
+from core.claude_client import get_client
 from core.models import BriefType, ComplianceReport
 from core.pdf_extract import extract_brief
 from core.recommender import compute_recommendation
 from core.report_builder import build_html_report
+from core.version_check import check_rule_hashes, get_version_stamp, load_local_version
 
 bp = Blueprint("main", __name__)
 
+_MAX_REPORTS = 256
+
+
+class _ReportStore(OrderedDict):
+    """In-memory LRU of recent reports; the oldest are evicted past *maxsize*."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return super().__getitem__(key)
+
+
 # In-memory report storage (no database for v1)
-reports: dict[str, tuple[ComplianceReport, str]] = {}  # id -> (report, html)
+reports: _ReportStore = _ReportStore(_MAX_REPORTS)  # id -> Future[(report, html)]
+
+
+@bp.record_once
+def _init_app(state) -> None:
+    """One-time setup at registration rather than per request.
+
+    Creates the upload folder and the analysis worker pool, and checks the
+    rule file hashes. Rule files only change on redeploy, so the stamp and
+    hash warnings are stored on the app config and reused for every report.
+    Rule staleness may need network access and has its own on-disk cache,
+    so it is not checked here.
+    """
+    app = state.app
+    os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
+    app.extensions["analysis_pool"] = ThreadPoolExecutor(
+        max_workers=app.config.get("ANALYSIS_WORKERS", 4),
+        thread_name_prefix="analysis",
+    )
+    app.config["VERSION_STAMP"] = get_version_stamp()
+    app.config["VERSION_WARNINGS"] = check_rule_hashes(load_local_version())
+    for warning in app.config["VERSION_WARNINGS"]:
+        app.logger.warning(warning)
 
 
 @bp.route("/")
@@ -39,114 +93,161 @@ def index():
 
 @bp.route("/analyze", methods=["POST"])
 def analyze():
-    """Handle PDF upload, run analysis, redirect to report."""
+    """Handle PDF upload, queue analysis, redirect to the report page."""
     if "pdf" not in request.files:
         flash("No file uploaded.", "error")
         return redirect(url_for("main.index"))
 
     file = request.files["pdf"]
-    if file.filename == "":
+    fname = file.filename or ""
+    if not fname:
         flash("No file selected.", "error")
         return redirect(url_for("main.index"))
 
-    if not file.filename.lower().endswith(".pdf"):
+    if not _is_pdf(fname):
         flash("Please upload a PDF file.", "error")
         return redirect(url_for("main.index"))
 
-    # Save uploaded file
-    upload_dir = current_app.config["UPLOAD_FOLDER"]
-    os.makedirs(upload_dir, exist_ok=True)
-    filename = secure_filename(file.filename)
-    filepath = os.path.join(upload_dir, f"{uuid.uuid4().hex}_{filename}")
-    file.save(filepath)
-
-    try:
-        report = _run_analysis(filepath, request.form.get("brief_type"))
-        report_id = uuid.uuid4().hex[:12]
-        report.report_id = report_id
-        html = build_html_report(report)
-        reports[report_id] = (report, html)
-        return redirect(url_for("main.report", report_id=report_id))
-    except Exception as e:
-        flash(f"Analysis failed: {e}", "error")
-        return redirect(url_for("main.index"))
-    finally:
-        # Clean up uploaded file
-        try:
-            os.unlink(filepath)
-        except OSError:
-            pass
+    # Save uploaded file (the upload folder is created at registration)
+    filepath = _save_upload(file, fname)
+    report_id, _ = _submit_analysis(filepath)
+    return redirect(url_for("main.report", report_id=report_id))
 
 
 @bp.route("/report/<report_id>")
 def report(report_id: str):
-    """Display a compliance report."""
-    entry = reports.get(report_id)
-    if entry is None:
+    """Display a compliance report, or a self-refreshing page while it runs."""
+    future = reports.get(report_id)
+    if future is None:
         flash("Report not found.", "error")
         return redirect(url_for("main.index"))
-    _, html = entry
+    if not future.done():
+        return render_template("pending.html"), 202
+    try:
+        _, html = future.result()
+    except Exception as e:
+        flash(f"Analysis failed: {e}", "error")
+        return redirect(url_for("main.index"))
     return html
 
 
 @bp.route("/api/analyze", methods=["POST"])
 def api_analyze():
-    """JSON API for brief analysis."""
+    """JSON API for brief analysis.
+
+    Returns 202 with the report id straight away; pass ``?wait=1`` to block
+    until the analysis finishes and get the full result.
+    """
     if "pdf" not in request.files:
-        return jsonify({"error": "No PDF file provided."}), 400
+        return _json({"error": "No PDF file provided."}, 400)
 
     file = request.files["pdf"]
-    if not file.filename.lower().endswith(".pdf"):
-        return jsonify({"error": "File must be a PDF."}), 400
+    fname = file.filename or ""
+    if not _is_pdf(fname):
+        return _json({"error": "File must be a PDF."}, 400)
+
+    filepath = _save_upload(file, fname)
+    report_id, future = _submit_analysis(filepath)
+    report_url = url_for("main.report", report_id=report_id, _external=True)
+
+    if request.args.get("wait") != "1":
+        return _json({
+            "report_id": report_id,
+            "status": "pending",
+            "report_url": report_url,
+        }, 202)
 
+    try:
+        # Wait on our own reference: the store may evict the entry meanwhile.
+        report, _ = future.result()
+    except Exception as e:
+        return _json({"error": str(e)}, 500)
+
+    return _json({**report.api_payload, "report_url": report_url})
+
+
+def _json(payload: dict, status: int = 200):
+    """JSON response serialized with orjson when it is installed."""
+    return current_app.response_class(
+        json_compat.dumps(payload), status=status, mimetype="application/json",
+    )
+
+
+_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB copies; briefs are often tens of MB
+_PDF_EXTS = frozenset({".pdf"})
+
+
+def _is_pdf(name: str) -> bool:
+    """True if *name* has a .pdf extension, in any case."""
+    return os.path.splitext(name)[1].lower() in _PDF_EXTS
+
+
+# Clients tend to re-upload the same filenames; skip the regex pass for those.
+_secure_filename = functools.lru_cache(maxsize=1024)(secure_filename)
+
+
+def _remove_upload(filepath: str) -> None:
+    try:
+        os.unlink(filepath)
+    except OSError:
+        pass
+
+
+def _save_upload(file, fname: str) -> str:
+    """Stream an uploaded file into the upload folder and return its path."""
     upload_dir = current_app.config["UPLOAD_FOLDER"]
-    os.makedirs(upload_dir, exist_ok=True)
-    filename = secure_filename(file.filename)
-    filepath = os.path.join(upload_dir, f"{uuid.uuid4().hex}_{filename}")
-    file.save(filepath)
+    filepath = os.path.join(upload_dir, f"{uuid.uuid4().hex}_{_secure_filename(fname)}")
+    with open(filepath, "wb") as out:
+        shutil.copyfileobj(file.stream, out, _UPLOAD_CHUNK_SIZE)
+    return filepath
+
+
+def _submit_analysis(filepath: str) -> tuple[str, Future]:
+    """Queue analysis of an uploaded PDF; return the new report id and its Future.
+
+    Config and form values are read here, on the request thread; the worker
+    has no app or request context.
+    """
+    config = current_app.config
+    report_id = uuid.uuid4().hex[:12]
+    future = current_app.extensions["analysis_pool"].submit(
+        _analyze_upload,
+        filepath,
+        report_id,
+        request.form.get("brief_type"),
+        config.get("ANTHROPIC_API_KEY", ""),
+        config.get("CLAUDE_MODEL", "claude-sonnet-4-6"),
+        config["VERSION_STAMP"],
+    )
+    reports[report_id] = future
+    return report_id, future
+
 
+def _analyze_upload(
+    filepath: str,
+    report_id: str,
+    brief_type_override: str | None,
+    api_key: str,
+    model: str,
+    version_stamp: str,
+) -> tuple[ComplianceReport, str]:
+    """Worker: analyze, render the HTML report, and delete the upload."""
     try:
-        report = _run_analysis(filepath, request.form.get("brief_type"))
-        report_id = uuid.uuid4().hex[:12]
+        report = _run_analysis(filepath, brief_type_override, api_key, model)
         report.report_id = report_id
-        html = build_html_report(report)
-        reports[report_id] = (report, html)
-
-        return jsonify({
-            "report_id": report_id,
-            "recommendation": report.recommendation.value,
-            "brief_type": report.brief_type.value,
-            "total_checks": len(report.results),
-            "failed_checks": len(report.failed_checks),
-            "passed_checks": len(report.passed_checks),
-            "reasoning": report.claude_reasoning,
-            "failures": [
-                {
-                    "check_id": r.check_id,
-                    "name": r.name,
-                    "rule": r.rule,
-                    "severity": r.severity.value,
-                    "message": r.message,
-                    "details": r.details,
-                }
-                for r in report.failed_checks
-            ],
-            "report_url": url_for("main.report", report_id=report_id, _external=True),
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return report, build_html_report(report, version_stamp=version_stamp)
     finally:
-        try:
-            os.unlink(filepath)
-        except OSError:
-            pass
+        # Clean up uploaded file
+        _remove_upload(filepath)
 
 
-def _run_analysis(filepath: str, brief_type_override: str | None = None) -> ComplianceReport:
+def _run_analysis(
+    filepath: str,
+    brief_type_override: str | None,
+    api_key: str,
+    model: str,
+) -> ComplianceReport:
     """Run the full analysis pipeline on a PDF."""
-    api_key = current_app.config.get("ANTHROPIC_API_KEY", "")
-    model = current_app.config.get("CLAUDE_MODEL", "claude-sonnet-4-6")
-
     # Extract PDF metadata
     metadata = extract_brief(filepath)
 
@@ -159,17 +260,15 @@ def _run_analysis(filepath: str, brief_type_override: str | None = None) -> Comp
     else:
         metadata.brief_type = classify_brief(metadata)
 
-    # Run mechanical checks
-    mech_results = run_mechanical_checks(metadata)
-
-    # Run semantic checks
-    sem_results = run_semantic_checks(metadata, api_key=api_key, model=model)
+    # Checks and recommendation share one client
+    client = get_client(api_key)
 
-    all_results = mech_results + sem_results
+    # Run mechanical and semantic checks
+    all_results = run_all_checks(metadata, api_key=api_key, model=model, client=client)
 
     # Compute recommendation
     recommendation, reasoning = compute_recommendation(
-        all_results, api_key=api_key, model=model,
+        all_results, api_key=api_key, model=model, client=client,
     )
 
     return ComplianceReport(